@@ -0,0 +1,24 @@
+import pytest
+
+from unclutter_directory.commons.logging import get_logger
+
+
+@pytest.fixture(autouse=True)
+def reset_package_logger():
+    """Undo level and handler changes made by setup_logging during a test."""
+    logger = get_logger()
+    handlers = logger.handlers[:]
+    level = logger.level
+    yield
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_home(tmp_path_factory):
+    """Keep caches written during a test out of the real user cache directory."""
+    # A private MonkeyPatch, so tests' own monkeypatch undo order is unchanged
+    with pytest.MonkeyPatch.context() as mp:
+        cache_home = tmp_path_factory.mktemp("cache")
+        mp.setenv("XDG_CACHE_HOME", str(cache_home))
+        yield cache_home
@@ -3,7 +3,12 @@ import zipfile
 from pathlib import Path
 from unittest.mock import patch
 
-from unclutter_directory.commands.delete_unpacked_command import DeleteUnpackedCommand
+import pytest
+
+from unclutter_directory.commands.delete_unpacked_command import (
+    LISTING_CACHE_FILE,
+    DeleteUnpackedCommand,
+)
 from unclutter_directory.comparison.archive_directory_comparator import ComparisonResult
 from unclutter_directory.config.delete_unpacked_config import DeleteUnpackedConfig
 
@@ -222,3 +227,98 @@ def test_delete_unpacked_interactive_skips(caplog):
                 mock_rmtree.assert_not_called()
                 assert dir_path.exists()
                 assert "Skipping deletion of test" in caplog.text
+
+
+def test_delete_unpacked_reuses_cached_archive_listing(isolated_cache_home):
+    """Test a second run reads the archive listing from the cache file."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+
+        dir_path = temp_path / "test"
+        dir_path.mkdir()
+        (dir_path / "file.txt").write_text("content")
+        (dir_path / "other.txt").write_text("different")
+
+        with zipfile.ZipFile(temp_path / "test.zip", "w") as z:
+            z.writestr("file.txt", "content")
+
+        config = DeleteUnpackedConfig(target_dir=temp_path, never_delete=True)
+        DeleteUnpackedCommand(config).execute()
+        assert (
+            isolated_cache_home / "unclutter-directory" / LISTING_CACHE_FILE
+        ).exists()
+        assert sorted(p.name for p in temp_path.iterdir()) == ["test", "test.zip"]
+
+        command = DeleteUnpackedCommand(config)
+        with patch(
+            "unclutter_directory.entities.compressed_archive.ZipArchive.get_files"
+        ) as mock_get_files:
+            result = command.comparator.compare_archive_and_directory(
+                temp_path / "test.zip", dir_path
+            )
+
+        mock_get_files.assert_not_called()
+        assert result.differences == ["Extra in directory: other.txt"]
+
+
+def test_delete_directories_handles_nested_pairs(caplog):
+    """Test a directory nested in another deleted one is not removed twice."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        nested = temp_path / "a" / "b"
+        nested.mkdir(parents=True)
+        (nested / "file.txt").write_text("content")
+        (temp_path / "c").mkdir()
+
+        config = DeleteUnpackedConfig(target_dir=temp_path, always_delete=True)
+        command = DeleteUnpackedCommand(config)
+        deleted = command._delete_directories(
+            [nested, temp_path / "a", temp_path / "c"]
+        )
+
+        assert deleted == 3
+        assert list(temp_path.iterdir()) == []
+        assert "Failed to delete" not in caplog.text
+
+
+def test_delete_unpacked_rereads_malformed_cache_entry():
+    """Test a malformed cache entry is ignored and the archive read again."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        dir_path = temp_path / "test"
+        dir_path.mkdir()
+        (dir_path / "file.txt").write_text("content")
+        archive_path = temp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w") as z:
+            z.writestr("file.txt", "content")
+
+        command = DeleteUnpackedCommand(
+            DeleteUnpackedConfig(target_dir=temp_path, never_delete=True)
+        )
+        stat = archive_path.stat()
+        command._listing_cache[str(archive_path.resolve())] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "files": [["file.txt", None]],
+        }
+
+        result = command.comparator.compare_archive_and_directory(
+            archive_path, dir_path
+        )
+
+        assert result.identical
+
+
+def test_delete_unpacked_config_rejects_missing_or_file_target():
+    """Test target validation reports one error for each kind of bad path."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        file_path = temp_path / "file.txt"
+        file_path.write_text("content")
+
+        with pytest.raises(ValueError, match="does not exist") as missing:
+            DeleteUnpackedConfig(target_dir=temp_path / "missing")
+        assert "not a directory" not in str(missing.value)
+
+        with pytest.raises(ValueError, match="is not a directory"):
+            DeleteUnpackedConfig(target_dir=file_path)
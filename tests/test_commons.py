@@ -1,5 +1,8 @@
+import logging
+
 import pytest
 
+from unclutter_directory.commons.logging import get_logger, setup_logging
 from unclutter_directory.commons.parsers import parse_size, parse_time
 from unclutter_directory.commons.validations import validate_rules_file
 
@@ -29,6 +32,9 @@ def test_parse_size_valid(input_str, expected):
         "invalid",
         "1.5.5GB",  # invalid float
         "1..5GB",  # invalid float
+        "1.",  # missing fraction digits
+        "1TB",  # unsupported unit
+        "1KBB",  # trailing garbage
     ],
 )
 def test_parse_size_invalid(input_str):
@@ -60,6 +66,8 @@ def test_parse_time_valid(input_str, expected):
         "invalid",
         "0.5.5h",  # invalid float
         "1..5d",  # invalid float
+        "5mm",  # trailing garbage
+        "h",  # missing number
     ],
 )
 def test_parse_time_invalid(input_str):
@@ -125,7 +133,10 @@ invalid_rules_cases = [
     ({"conditions": {"older": "abc"}, "action": {}}, None),
     ({"conditions": {"regex": "[invalid[regex]"}, "action": {}}, None),
     ({"conditions": {"larger": "10MB"}, "action": {}}, None),
-    ({"conditions": {"larger": "10MB"}, "action": {"type": "invalid_type"}}, None),
+    (
+        {"conditions": {"larger": "10MB"}, "action": {"type": "invalid_type"}},
+        "valid options: compress, delete, move",
+    ),
     ({"conditions": {"larger": "10MB"}, "action": {"type": "move"}}, "'target'"),
     (
         {
@@ -146,6 +157,30 @@ def test_validate_rules_invalid(rule, expected_error):
         assert any(expected_error in error for error in errors)
 
 
+@pytest.mark.parametrize(
+    "target, suspicious",
+    [
+        ("../outside", True),
+        ("archive/..../x", True),
+        ("....", True),
+        ("archive/file....txt", False),
+        ("a/b/c", False),
+    ],
+)
+def test_validate_rules_suspicious_target(target, suspicious):
+    rule = {
+        "conditions": {"larger": "10MB"},
+        "action": {"type": "move", "target": target},
+    }
+    errors = validate_rules_file([rule])
+    assert any("suspicious" in error for error in errors) == suspicious
+
+
+def test_validate_rules_incomplete_rule_skips_condition_checks():
+    errors = validate_rules_file([{"conditions": {"larger": "abc"}}])
+    assert errors == ["Rule #1: Missing required field(s): action"]
+
+
 @pytest.mark.parametrize(
     "rule, expected_error_count, expected_error_substring",
     [
@@ -193,3 +228,23 @@ def test_validate_rules_delete_unpacked_on_match(
     assert len(errors) == expected_error_count
     if expected_error_substring:
         assert expected_error_substring in errors[0]
+
+
+def test_setup_logging_is_idempotent():
+    logger = get_logger()
+    logger.handlers.clear()
+
+    setup_logging()
+    setup_logging(quiet=True)
+
+    assert len(logger.handlers) == 1
+    assert logger.level == logging.ERROR
+
+
+def test_validate_rules_logs_errors_as_one_record(caplog):
+    with caplog.at_level(logging.ERROR, logger=get_logger().name):
+        errors = validate_rules_file(["not a dict", {"conditions": {}}])
+
+    assert len(errors) == 2
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage().count("\n• ") == 2
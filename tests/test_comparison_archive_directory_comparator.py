@@ -5,10 +5,17 @@ Tests for ArchiveDirectoryComparator.
 import tempfile
 import zipfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from unclutter_directory.comparison import ArchiveDirectoryComparator, ComparisonResult
+from unclutter_directory.comparison.archive_directory_comparator import (
+    MAX_REPORTED_PATHS,
+)
+from unclutter_directory.entities.file import File
+
+COMPARATOR_MODULE = "unclutter_directory.comparison.archive_directory_comparator"
 
 
 @pytest.fixture
@@ -72,6 +79,50 @@ def test_with_matching_directory(comparator_and_root, extension, request):
     assert result[0][1] == test_dir
 
 
+def test_iter_potential_duplicates_streams_pairs(comparator_and_root):
+    """Test pairs can be consumed one at a time from the generator."""
+    comparator, root = comparator_and_root
+    (root / "pack").mkdir()
+    archive_path = root / "pack.zip"
+    with zipfile.ZipFile(archive_path, "w") as zf:
+        zf.writestr("file1.txt", "content")
+
+    pairs = comparator.iter_potential_duplicates(root)
+    assert next(pairs) == (archive_path, root / "pack")
+    assert next(pairs, None) is None
+
+
+def test_find_duplicates_in_wide_tree(comparator_and_root):
+    """Test pair discovery on a tree wide enough to use the parallel scan."""
+    comparator, root = comparator_and_root
+    expected = []
+    for i in range(6):
+        branch = root / f"branch{i}" / "nested"
+        (branch / "pack").mkdir(parents=True)
+        archive_path = branch / "pack.zip"
+        with zipfile.ZipFile(archive_path, "w") as zf:
+            zf.writestr("file1.txt", "content")
+        (branch / "notes.txt").write_text("not an archive")
+        expected.append((archive_path, branch / "pack"))
+
+    result = comparator.find_potential_duplicates(root)
+    assert sorted(result) == sorted(expected)
+
+
+def test_find_duplicates_matches_archive_suffix_case_insensitively(
+    comparator_and_root,
+):
+    """Test archive detection by extension, including upper-case suffixes."""
+    comparator, root = comparator_and_root
+    (root / "Photos").mkdir()
+    (root / "Photos.ZIP").write_bytes(b"")
+    (root / "notes").mkdir()
+    (root / "notes.txt").write_text("not an archive")
+
+    result = comparator.find_potential_duplicates(root)
+    assert result == [(root / "Photos.ZIP", root / "Photos")]
+
+
 @pytest.mark.parametrize(
     "case",
     [
@@ -117,6 +168,134 @@ def test_compare_structures(comparator_and_root, case):
         assert len(result.differences) > 0
 
 
+@pytest.mark.parametrize(
+    "zip_files, expected",
+    [
+        ([("a.txt", "1"), ("b.txt", "2")], []),
+        ([("a.txt", "1")], ["File count mismatch: archive=1, directory=2"]),
+        (
+            [("a.txt", "1"), ("c.txt", "2")],
+            ["File names differ between archive and directory"],
+        ),
+        ([("a.txt", "1"), ("b.txt", "22")], ["Size mismatch for b.txt"]),
+    ],
+)
+def test_compare_structures_fast_mismatch_only(
+    comparator_and_root, zip_files, expected
+):
+    """Test the summary-only comparison reports at most one difference."""
+    _, root = comparator_and_root
+    comparator = ArchiveDirectoryComparator(fast_mismatch_only=True)
+    test_dir = root / "test"
+    test_dir.mkdir()
+    (test_dir / "a.txt").write_text("1")
+    (test_dir / "b.txt").write_text("2")
+    zip_path = root / "test.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for filename, content in zip_files:
+            zf.writestr(filename, content)
+
+    result = comparator.compare_archive_and_directory(zip_path, test_dir)
+    assert result.identical == (not expected)
+    assert len(result.differences) == len(expected)
+    for difference, prefix in zip(result.differences, expected, strict=True):
+        assert difference.startswith(prefix)
+
+
+def _make_compare_pairs(root: Path, count: int) -> list[tuple[Path, Path]]:
+    """Create archive-directory pairs whose odd-numbered archives differ."""
+    pairs = []
+    for i in range(count):
+        directory = root / f"pack{i}"
+        directory.mkdir()
+        (directory / "file.txt").write_text("content")
+        archive_path = root / f"pack{i}.zip"
+        with zipfile.ZipFile(archive_path, "w") as zf:
+            zf.writestr("file.txt", "content" if i % 2 == 0 else "changed!")
+        pairs.append((archive_path, directory))
+    return pairs
+
+
+def test_compare_all_in_worker_processes_keeps_listings(comparator_and_root, caplog):
+    """Test parallel comparison preserves order, merges listings and logs."""
+    _, root = comparator_and_root
+    listing_cache = {}
+    comparator = ArchiveDirectoryComparator(listing_cache=listing_cache)
+    pairs = _make_compare_pairs(root, 6)
+    broken = root / "broken.zip"
+    broken.write_bytes(b"not a zip")
+    (root / "broken").mkdir()
+    pairs.append((broken, root / "broken"))
+    # Cached before the run, so compared in-process rather than in a worker
+    comparator.compare_archive_and_directory(*pairs[0])
+
+    with patch(f"{COMPARATOR_MODULE}.PARALLEL_COMPARE_THRESHOLD", 4):
+        results = comparator.compare_all(pairs, max_workers=2)
+
+    assert [(r.archive_path, r.directory_path) for r in results] == pairs
+    assert [r.identical for r in results] == [True, False] * 3 + [False]
+    assert sorted(listing_cache) == sorted(str(a.absolute()) for a, _ in pairs[:6])
+    assert f"Error reading zip file: {broken}" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "max_workers, count, cached",
+    [(1, 8, False), (2, 3, False), (2, 8, True)],
+    ids=["single-cpu", "few-pairs", "all-cached"],
+)
+def test_compare_all_serial_without_pool(
+    comparator_and_root, max_workers, count, cached
+):
+    """Test no process pool starts when it cannot pay off."""
+    _, root = comparator_and_root
+    comparator = ArchiveDirectoryComparator(listing_cache={})
+    pairs = _make_compare_pairs(root, count)
+    if cached:
+        for pair in pairs:
+            comparator.compare_archive_and_directory(*pair)
+
+    with (
+        patch(f"{COMPARATOR_MODULE}.PARALLEL_COMPARE_THRESHOLD", 4),
+        patch(f"{COMPARATOR_MODULE}.ProcessPoolExecutor") as mock_pool,
+    ):
+        results = comparator.compare_all(pairs, max_workers=max_workers)
+
+    mock_pool.assert_not_called()
+    assert [r.identical for r in results] == [i % 2 == 0 for i in range(count)]
+
+
+def test_empty_archive_skips_directory_walk(comparator_and_root):
+    """Test an empty archive is reported without listing the directory."""
+    comparator, root = comparator_and_root
+    test_dir = root / "test"
+    test_dir.mkdir()
+    zip_path = root / "test.zip"
+    with zipfile.ZipFile(zip_path, "w"):
+        pass
+
+    with patch.object(comparator.directory_analyzer, "get_files") as mock_get_files:
+        result = comparator.compare_archive_and_directory(zip_path, test_dir)
+
+    mock_get_files.assert_not_called()
+    assert not result.identical
+    assert result.differences == ["Archive is empty or could not be read"]
+
+
+def test_compare_structures_caps_reported_paths(comparator_and_root):
+    """Test long missing/extra lists are truncated after the first paths."""
+    comparator, root = comparator_and_root
+    archive_files = [File(root, "shared.txt", 0, 1)]
+    directory_files = archive_files + [
+        File(root, f"extra{i:03}.txt", 0, 1) for i in range(MAX_REPORTED_PATHS + 5)
+    ]
+
+    differences = comparator._compare_file_structures(archive_files, directory_files)
+
+    assert len(differences) == MAX_REPORTED_PATHS + 1
+    assert differences[0] == "Extra in directory: extra000.txt"
+    assert differences[-1] == "Extra in directory: ... and 5 more"
+
+
 def test_unsupported_archive_format(comparator_and_root):
     """Test handling of unsupported archive format."""
     comparator, root = comparator_and_root
@@ -147,3 +326,15 @@ def test_compare_summary(comparator_and_root):
     assert summary["identical"] == 1
     assert summary["different"] == 1
     assert summary["identical_percentage"] == 50.0
+
+
+def test_normalize_unicode_skips_nfc_for_ascii():
+    """Test ASCII names bypass NFC while non-ASCII names are composed."""
+    comparator = ArchiveDirectoryComparator()
+    target = "unclutter_directory.comparison.archive_directory_comparator._nfc"
+
+    with patch(target) as nfc:
+        assert comparator._normalize_unicode("docs/readme.txt") == "docs/readme.txt"
+    nfc.assert_not_called()
+
+    assert comparator._normalize_unicode("Imágenes") == "Imágenes"
@@ -59,6 +59,43 @@ def test_directory_analyzer_with_subdirectories(temp_dir):
             assert file.size == 0
 
 
+def test_directory_analyzer_skips_hidden_and_symlinked_directories(temp_dir):
+    """Test DirectoryAnalyzer prunes hidden entries and does not follow dir links."""
+    test_dir = temp_dir / "test"
+    (test_dir / "sub" / "deep").mkdir(parents=True)
+    (test_dir / ".hidden").mkdir()
+    (test_dir / "sub" / "deep" / "file.txt").write_text("content")
+    (test_dir / ".hidden" / "secret.txt").write_text("secret")
+    (test_dir / ".dotfile").write_text("dot")
+    (test_dir / "linked").symlink_to(test_dir / "sub", target_is_directory=True)
+
+    files = DirectoryAnalyzer().get_files(test_dir)
+
+    assert [f.name for f in files] == ["sub/", "sub/deep/", "sub/deep/file.txt"]
+    assert files[-1].path == test_dir / "sub" / "deep"
+    assert files[-1].size == len("content")
+
+
+def test_directory_analyzer_parallel_scan_matches_serial(temp_dir, monkeypatch):
+    """Test the thread-pool scan yields the same entries in the same order."""
+    test_dir = temp_dir / "test"
+    for i in range(3):
+        for j in range(3):
+            nested = test_dir / f"dir{i}" / f"sub{j}"
+            nested.mkdir(parents=True)
+            (nested / f"file{i}{j}.txt").write_text("x" * (i + j))
+        (test_dir / f"dir{i}" / "top.txt").write_text("top")
+
+    serial = [(f.name, f.size) for f in DirectoryAnalyzer().get_files(test_dir)]
+    monkeypatch.setattr(
+        "unclutter_directory.comparison.directory_analyzer.PARALLEL_ANALYSIS_THRESHOLD",
+        0,
+    )
+    parallel = [(f.name, f.size) for f in DirectoryAnalyzer().get_files(test_dir)]
+
+    assert parallel == serial
+
+
 def test_zip_with_subdirectories_real_file():
     """Test ZIP archive with subdirectories using real file."""
     data_dir = Path("tests/data/archives")
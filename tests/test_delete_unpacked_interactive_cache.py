@@ -115,5 +115,40 @@ def test_delete_unpacked_interactive_cache_never():
         assert dir2_path.exists()
 
 
+@pytest.mark.parametrize(
+    "per_item_prompt, expected_prompts", [(False, 1), (True, 2)], ids=["batch", "each"]
+)
+def test_delete_unpacked_prompt_count(per_item_prompt, expected_prompts):
+    """Test batch mode asks once for all duplicates, per-item mode asks for each"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+
+        directories = []
+        for name in ("test1", "test2"):
+            dir_path = temp_path / name
+            dir_path.mkdir()
+            (dir_path / "file.txt").write_text("content")
+            with zipfile.ZipFile(temp_path / f"{name}.zip", "w") as zf:
+                zf.writestr("file.txt", "content")
+            directories.append(dir_path)
+
+        config = DeleteUnpackedConfig(
+            target_dir=temp_path, quiet=True, per_item_prompt=per_item_prompt
+        )
+        command = DeleteUnpackedCommand(config)
+
+        input_calls = []
+
+        def mock_input(prompt):
+            input_calls.append(prompt)
+            return "y"
+
+        with patch("builtins.input", side_effect=mock_input):
+            command.execute()
+
+        assert len(input_calls) == expected_prompts
+        assert not any(dir_path.exists() for dir_path in directories)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
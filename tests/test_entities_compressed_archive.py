@@ -4,10 +4,12 @@ Tests for CompressedArchive implementations and handlers.
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from unclutter_directory.entities.compressed_archive import (
+    ArchiveHandler,
     ArchiveHandlerChain,
     RarArchive,
     RarHandler,
@@ -131,3 +133,70 @@ def test_get_archive_manager(sample_files, file_key, expected_type):
     file_obj = sample_files[file_key]
     archive = get_archive_manager(file_obj)
     assert isinstance(archive, expected_type)
+
+
+def test_get_archive_manager_reuses_default_chain(sample_files):
+    """Test get_archive_manager does not build a new handler chain per lookup."""
+    with patch(
+        "unclutter_directory.entities.compressed_archive.ArchiveHandlerChain"
+    ) as chain_cls:
+        assert isinstance(get_archive_manager(sample_files["zip"]), ZipArchive)
+    chain_cls.assert_not_called()
+
+
+def test_archive_handler_chain_custom_handlers(temp_dir):
+    """Test custom handlers are found by extension or by probing can_handle."""
+
+    class TarHandler(ArchiveHandler):
+        extensions = (".tar",)
+
+        def can_handle(self, file):
+            return file.name.lower().endswith(self.extensions)
+
+        def create_instance(self):
+            return ZipArchive()
+
+    class MagicHandler(ArchiveHandler):
+        def can_handle(self, file):
+            return file.name.startswith("magic")
+
+        def create_instance(self):
+            return RarArchive()
+
+    chain = ArchiveHandlerChain()
+    chain.add_handler(TarHandler())
+    chain.add_handler(MagicHandler())
+
+    assert isinstance(
+        chain.get_archive_handler(File(temp_dir, "BACKUP.TAR", None, None)),
+        ZipArchive,
+    )
+    assert isinstance(
+        chain.get_archive_handler(File(temp_dir, "magic_bundle", None, None)),
+        RarArchive,
+    )
+    assert chain.get_archive_handler(File(temp_dir, "plain", None, None)) is None
+
+
+@pytest.mark.parametrize("file_key", ["zip", "rar"])
+def test_iter_files_streams_archive_listing(sample_files, file_key):
+    """Test iter_files yields the same members as get_files, lazily."""
+    file_obj = sample_files[file_key]
+    archive = get_archive_manager(file_obj)
+
+    members = archive.iter_files(file_obj)
+    assert next(members).name == "file1.txt"
+    members.close()
+
+    assert [f.name for f in archive.iter_files(file_obj)] == [
+        f.name for f in archive.get_files(file_obj)
+    ]
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [("BACKUP.ZIP", True), ("backup.Zip", True), ("zip", False), ("a.zipx", False)],
+)
+def test_handler_can_handle_ignores_suffix_case(temp_dir, name, expected):
+    """Test handlers match their extension case-insensitively."""
+    assert ZipHandler().can_handle(File(temp_dir, name, None, None)) is expected
@@ -73,6 +73,22 @@ def test_directory_size_calculation(temp_dir):
     assert dir_obj.is_directory
 
 
+def test_directory_size_skips_symlinked_directories(temp_dir):
+    """Test directory size counts nested files but not symlinked directories."""
+    dir_path = temp_dir / "dir"
+    (dir_path / "a" / "b").mkdir(parents=True)
+    (dir_path / "a" / "b" / "deep.txt").write_text("deep")  # size 4
+    (dir_path / ".hidden").write_text("hidden")  # size 6
+    (dir_path / "link").symlink_to(dir_path / "a", target_is_directory=True)
+
+    dir_obj = File.from_path(dir_path)
+    assert dir_obj.size == 10
+    assert dir_obj.date == max(
+        (dir_path / ".hidden").stat().st_mtime,
+        (dir_path / "a" / "b" / "deep.txt").stat().st_mtime,
+    )
+
+
 def test_directory_date_calculation(temp_dir):
     """Test fecha de directorio usa la más nueva."""
     root = temp_dir
@@ -239,3 +255,15 @@ def test_date_tuple_normalization_raises_value_error(temp_dir, date_tuple):
     # Expect ValueError to be raised
     with pytest.raises(ValueError):
         File(test_path, "dummy.txt", date_tuple, 0)
+
+
+def test_date_tuple_normalization_is_cached(temp_dir):
+    """Test repeated archive timestamps are normalized only once."""
+    File._normalize_date_tuple.cache_clear()
+
+    first = File(temp_dir, "a.txt", (2023, 4, 32, 8, 0, 0), 0)
+    second = File(temp_dir, "b.txt", (2023, 4, 32, 8, 0, 0), 0)
+
+    assert first.date == second.date
+    info = File._normalize_date_tuple.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
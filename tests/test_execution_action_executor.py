@@ -1,3 +1,4 @@
+import errno
 import logging
 import shutil
 import tempfile
@@ -9,6 +10,7 @@ import pytest
 
 from unclutter_directory.config.organize_config import OrganizeConfig
 from unclutter_directory.execution.action_executor import ActionExecutor
+from unclutter_directory.execution.action_strategies import MoveStrategy
 
 
 def create_test_structure(temp_dir: Path, structure: list[str]):
@@ -70,6 +72,20 @@ def test_move_with_conflict(temp_dir_setup):
     assert not test_file.exists()
 
 
+def test_resolve_conflict_lists_directory_once(temp_dir_setup, mocker):
+    """Conflict resolution picks the first free suffix from one listing"""
+    temp_dir, test_file = temp_dir_setup
+    for name in ["test_file_1.txt", "test_file_2.txt", "test_file_4.txt"]:
+        (temp_dir / name).touch()
+    exists = mocker.spy(Path, "exists")
+
+    resolved = MoveStrategy(logging.getLogger())._resolve_conflict(test_file)
+
+    assert resolved == temp_dir / "test_file_3.txt"
+    # One check for the original name, one for the chosen candidate
+    assert exists.call_count == 2
+
+
 def test_move_absolute_path(temp_dir_setup):
     """Move using absolute path"""
     temp_dir, test_file = temp_dir_setup
@@ -104,6 +120,25 @@ def test_move_nested_directories(temp_dir_setup):
     assert (target / test_file.name).exists()
 
 
+def test_move_relative_target_dir(temp_dir_setup, monkeypatch):
+    """Move a file found under a relative target dir such as '.'"""
+    temp_dir, test_file = temp_dir_setup
+    monkeypatch.chdir(temp_dir)
+    parent = Path(".")
+    source = next(p for p in parent.iterdir() if p.name == test_file.name)
+
+    result = ActionExecutor({"type": "move", "target": "target"}).execute_action(
+        source,
+        parent,
+        {"delete_unpacked_on_match": False},
+        Mock(spec=OrganizeConfig),
+    )
+
+    assert result == Path("target") / test_file.name
+    assert (temp_dir / "target" / test_file.name).exists()
+    assert not test_file.exists()
+
+
 def test_delete_basic(temp_dir_setup):
     """Basic delete"""
     temp_dir, test_file = temp_dir_setup
@@ -254,7 +289,7 @@ def test_invalid_action(temp_dir_setup, caplog):
 def test_move_error_handling(temp_dir_setup, mocker, caplog):
     """Error handling during movement"""
     temp_dir, test_file = temp_dir_setup
-    mock_move = mocker.patch("shutil.move")
+    mock_move = mocker.patch("os.rename")
     mock_move.side_effect = Exception("Simulated error")
     action = {"type": "move", "target": str(temp_dir / "target")}
 
@@ -268,6 +303,30 @@ def test_move_error_handling(temp_dir_setup, mocker, caplog):
     assert "Unexpected error processing" in caplog.text
 
 
+@pytest.mark.parametrize("source_name", ["test_file.txt", "tree"])
+def test_move_across_filesystems(temp_dir_setup, mocker, source_name):
+    """Cross-device moves copy files and directories and remove the source"""
+    temp_dir, test_file = temp_dir_setup
+    test_file.write_text("payload")
+    create_test_structure(temp_dir, ["tree/nested/file.txt"])
+    (temp_dir / "tree" / "nested" / "file.txt").write_text("payload")
+    # Every rename fails, as it would between two filesystems
+    mocker.patch("os.rename", side_effect=OSError(errno.EXDEV, "Cross-device link"))
+    source = temp_dir / source_name
+
+    result = ActionExecutor({"type": "move", "target": "target"}).execute_action(
+        source,
+        temp_dir,
+        {"delete_unpacked_on_match": False},
+        Mock(spec=OrganizeConfig),
+    )
+
+    assert result == temp_dir / "target" / source_name
+    copied = result if result.is_file() else result / "nested" / "file.txt"
+    assert copied.read_text() == "payload"
+    assert not source.exists()
+
+
 def test_delete_error_handling(temp_dir_setup, monkeypatch, caplog):
     """Error handling during delete"""
     temp_dir, test_file = temp_dir_setup
@@ -275,7 +334,7 @@ def test_delete_error_handling(temp_dir_setup, monkeypatch, caplog):
     def mock_unlink(*args, **kwargs):
         raise Exception("Simulated error")
 
-    monkeypatch.setattr(Path, "unlink", mock_unlink)
+    monkeypatch.setattr("os.unlink", mock_unlink)
     result = ActionExecutor({"type": "delete"}).execute_action(
         test_file,
         temp_dir,
@@ -286,6 +345,24 @@ def test_delete_error_handling(temp_dir_setup, monkeypatch, caplog):
     assert "Error deleting " in caplog.text
 
 
+def test_delete_vanished_path(temp_dir_setup, caplog):
+    """Deleting a path that is already gone logs a warning"""
+    temp_dir, test_file = temp_dir_setup
+    test_file.unlink()
+
+    with caplog.at_level(logging.WARNING):
+        result = ActionExecutor({"type": "delete"}).execute_action(
+            test_file,
+            temp_dir,
+            {"delete_unpacked_on_match": False},
+            Mock(spec=OrganizeConfig),
+        )
+
+    assert result is None
+    assert "Path vanished before deletion" in caplog.text
+    assert "Error deleting" not in caplog.text
+
+
 def test_delete_directory(temp_dir_setup):
     """Delete directory with nested content"""
     temp_dir, _ = temp_dir_setup
@@ -438,3 +515,81 @@ def test_compress_directory_with_empty_subdirectory(temp_dir_setup):
 
     with zipfile.ZipFile(temp_dir / "output" / "dir.zip") as z:
         assert "dir/empty/" in z.namelist()
+
+
+def test_compress_directory_relative_parent(temp_dir_setup, monkeypatch):
+    """Compress a directory when the target dir is given as a relative path"""
+    temp_dir, _ = temp_dir_setup
+    create_test_structure(temp_dir, ["proj/f.txt", "proj/empty/"])
+    monkeypatch.chdir(temp_dir)
+
+    result = ActionExecutor({"type": "compress", "target": "archives"}).execute_action(
+        Path("proj"),
+        Path("."),
+        {"delete_unpacked_on_match": False},
+        Mock(spec=OrganizeConfig),
+    )
+    assert isinstance(result, Path)
+
+    with zipfile.ZipFile(temp_dir / "archives" / "proj.zip") as z:
+        assert sorted(z.namelist()) == ["proj/empty/", "proj/f.txt"]
+    assert not (temp_dir / "proj").exists()
+
+
+def test_compress_large_file_round_trips(temp_dir_setup):
+    """Compress a file larger than the copy buffer and check its contents"""
+    temp_dir, _ = temp_dir_setup
+    test_dir = temp_dir / "big"
+    test_dir.mkdir()
+    payload = bytes(range(256)) * 8192 + b"tail"  # Just over 2 MiB
+    (test_dir / "data.bin").write_bytes(payload)
+
+    ActionExecutor({"type": "compress", "target": "archives"}).execute_action(
+        test_dir,
+        temp_dir,
+        {"delete_unpacked_on_match": False},
+        Mock(spec=OrganizeConfig),
+    )
+
+    with zipfile.ZipFile(temp_dir / "archives" / "big.zip") as z:
+        info = z.getinfo("big/data.bin")
+        assert info.compress_type == zipfile.ZIP_DEFLATED
+        assert z.read(info) == payload
+
+
+def test_archive_probe_skipped_without_cleanup(temp_dir_setup, mocker):
+    """Rules without delete_unpacked_on_match never probe for archives"""
+    temp_dir, _ = temp_dir_setup
+    archive = temp_dir / "bundle.zip"
+    archive.touch()
+    probe = mocker.patch(
+        "unclutter_directory.execution.action_executor.get_archive_manager"
+    )
+
+    ActionExecutor({"type": "move", "target": "target"}).execute_action(
+        archive,
+        temp_dir,
+        {"delete_unpacked_on_match": False},
+        Mock(spec=OrganizeConfig),
+    )
+
+    probe.assert_not_called()
+
+
+def test_cleanup_runs_for_preexisting_archive(temp_dir_setup, mocker):
+    """Moving an archive with delete_unpacked_on_match cleans its unpacked copy"""
+    temp_dir, _ = temp_dir_setup
+    archive = temp_dir / "bundle.zip"
+    archive.touch()
+    cleaner_cls = mocker.patch(
+        "unclutter_directory.execution.action_executor.UnpackedDirectoryCleaner"
+    )
+    config = Mock(spec=OrganizeConfig)
+
+    result = ActionExecutor({"type": "move", "target": "target"}).execute_action(
+        archive, temp_dir, {"delete_unpacked_on_match": True}, config
+    )
+
+    assert result == temp_dir / "target" / "bundle.zip"
+    cleaner_cls.assert_called_once_with(config)
+    cleaner_cls.return_value.clean.assert_called_once_with(archive, result)
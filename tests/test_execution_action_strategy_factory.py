@@ -181,3 +181,14 @@ def test_register_strategy_invalid_callable(factory):
 
     with pytest.raises(ValueError):
         factory.register_strategy("mock", not_a_class)
+
+
+def test_create_strategy_reuses_instances(factory):
+    """Test strategies are created once per action type and logger"""
+    logger = Mock()
+
+    first = factory.create_strategy("move", logger)
+
+    assert factory.create_strategy("move", logger) is first
+    assert factory.create_strategy("move", Mock()) is not first
+    assert factory.create_strategy("delete", logger) is not first
@@ -4,9 +4,12 @@ Unit tests for the confirmation handlers.
 
 from unittest.mock import patch
 
+import pytest
+
 from unclutter_directory.execution.confirmation import (
     AutomaticConfirmationHandler,
     DryRunConfirmationHandler,
+    _render_prompt,
 )
 
 
@@ -23,7 +26,9 @@ def test_dry_run_handler_delete():
         )
 
         # Should log the dry run action
-        mock_logger.assert_called_once_with("[DRY RUN] Would delete for test file")
+        mock_logger.assert_called_once_with(
+            "[DRY RUN] Would %s for %s", "delete", "test file"
+        )
         # Should always return False
         assert result is False
 
@@ -41,7 +46,9 @@ def test_dry_run_handler_non_delete():
         )
 
         # Should log the dry run action with the action type
-        mock_logger.assert_called_once_with("[DRY RUN] Would move for test file")
+        mock_logger.assert_called_once_with(
+            "[DRY RUN] Would %s for %s", "move", "test file"
+        )
         # Should always return False
         assert result is False
 
@@ -75,7 +82,7 @@ def test_automatic_handler_delete_false():
 
         # Should log the skip message
         mock_logger.assert_called_once_with(
-            "Skipping delete action for test file (automatic mode)"
+            "Skipping delete action for %s (automatic mode)", "test file"
         )
         # Should return False when always_confirm is False
         assert result is False
@@ -100,3 +107,17 @@ def test_automatic_handler_non_delete():
 
     assert result1 is True
     assert result2 is True
+
+
+@pytest.mark.parametrize(
+    "template, expected",
+    [
+        ("Delete {context}? [Y/N/A/Never]: ", "Delete dir '{x}'? [Y/N/A/Never]: "),
+        ("{context}", "dir '{x}'"),
+        ("{{literal}} {context}: ", "{literal} dir '{x}': "),
+    ],
+)
+def test_render_prompt_matches_format(template, expected):
+    """Test that prompt rendering matches str.format for any template"""
+    assert _render_prompt(template, "dir '{x}'") == expected
+    assert _render_prompt(template, "dir '{x}'") == template.format(context="dir '{x}'")
@@ -1,3 +1,4 @@
+import re
 from datetime import timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -6,7 +7,7 @@ import pytest
 
 from unclutter_directory.entities.compressed_archive import CompressedArchive
 from unclutter_directory.entities.file import File
-from unclutter_directory.file_operations.file_matcher import FileMatcher
+from unclutter_directory.file_operations.file_matcher import CompiledRule, FileMatcher
 
 
 @pytest.fixture
@@ -141,7 +142,7 @@ def test_archive_match(data):
         "unclutter_directory.file_operations.file_matcher.get_archive_manager"
     ) as mock_get_archive:
         mock_archive_manager = MagicMock(spec=CompressedArchive)
-        mock_archive_manager.get_files.return_value = [file_in_zip]
+        mock_archive_manager.iter_files.return_value = iter([file_in_zip])
         mock_get_archive.return_value = mock_archive_manager
 
         rule_check_archive = {
@@ -262,3 +263,36 @@ def test_match_name_regex_case_sensitive(data):
     )
     matched_rule = matcher.match(file1_upper)
     assert matched_rule is None
+
+
+def test_matcher_precompiles_regex_conditions(data):
+    with patch(
+        "unclutter_directory.file_operations.file_matcher.re.compile"
+    ) as mock_compiled:
+        FileMatcher(
+            [
+                data["rule_name_regex"],
+                {"conditions": {"regex": "^EX"}, "case_sensitive": True},
+                data["rule_name_start"],
+            ]
+        )
+
+    assert mock_compiled.call_args_list == [
+        (("^exampl.*", re.IGNORECASE),),
+        (("^EX", 0),),
+    ]
+
+
+def test_matcher_rejects_invalid_regex_on_construction():
+    with pytest.raises(re.error):
+        FileMatcher([{"conditions": {"regex": "[unclosed"}}])
+
+
+def test_compiled_rule_parses_thresholds_once():
+    compiled = CompiledRule.from_rule(
+        {"conditions": {"larger": "1KB", "older": "2h"}, "case_sensitive": True}
+    )
+
+    assert (compiled.larger, compiled.smaller) == (1024, None)
+    assert (compiled.older, compiled.newer) == (7200, None)
+    assert compiled.regex is None
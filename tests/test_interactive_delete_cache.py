@@ -112,3 +112,46 @@ def test_interactive_confirmation_handler_non_delete_always_true():
 
     assert result1 is True
     assert result2 is True
+
+
+def test_interactive_confirmation_handler_individual_answer_not_cached():
+    """Test that a plain 'n' answer is asked again by default"""
+    handler = InteractiveConfirmationHandler()
+
+    with patch("builtins.input", return_value="n") as mock_input:
+        for name in ("file1", "file2"):
+            assert not handler.should_execute(
+                context_info=name,
+                prompt_template="Delete {context}? ",
+                cache_key="key1",
+                action_type="delete",
+            )
+
+    assert [c.args for c in mock_input.call_args_list] == [
+        ("Delete file1? ",),
+        ("Delete file2? ",),
+    ]
+
+
+def test_interactive_confirmation_handler_remember_per_key():
+    """Test that y/n answers are reused per cache key when enabled"""
+    handler = InteractiveConfirmationHandler(remember_per_key=True)
+
+    with patch("builtins.input", side_effect=["n", "y"]) as mock_input:
+        results = [
+            handler.should_execute(
+                context_info=name,
+                prompt_template="Delete {context}? ",
+                cache_key=key,
+                action_type="delete",
+            )
+            for name, key in [
+                ("file1", "key1"),
+                ("file2", "key1"),
+                ("file3", "key2"),
+                ("file4", "key2"),
+            ]
+        ]
+
+    assert results == [False, False, True, True]
+    assert mock_input.call_count == 2
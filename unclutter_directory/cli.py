@@ -38,6 +38,11 @@ def cli():
 @click.option(
     "--include-hidden", is_flag=True, help="Process hidden files and directories"
 )
+@click.option(
+    "--remember-answers",
+    is_flag=True,
+    help="Reuse each yes/no answer for the remaining files of the same rule",
+)
 def organize(
     target_dir: Path,
     rules_file: str | None,
@@ -46,6 +51,7 @@ def organize(
     always_delete: bool,
     never_delete: bool,
     include_hidden: bool,
+    remember_answers: bool,
 ) -> None:
     """
     Organize files in TARGET_DIR based on rules from RULES_FILE.
@@ -62,6 +68,7 @@ def organize(
             always_delete=always_delete,
             never_delete=never_delete,
             include_hidden=include_hidden,
+            remember_answers=remember_answers,
         )
 
         # Execute organize command
@@ -133,12 +140,18 @@ def validate(rules_file: str) -> None:
     is_flag=True,
     help="Include hidden files and directories in comparison",
 )
+@click.option(
+    "--per-item-prompt",
+    is_flag=True,
+    help="Ask about each duplicate as soon as it is found instead of once for all",
+)
 @click.option("--quiet", "-q", is_flag=True, help="Suppress non-error messages")
 def delete_unpacked(
     target_dir: Path,
     always_delete: bool,
     never_delete: bool,
     include_hidden: bool,
+    per_item_prompt: bool,
     quiet: bool,
 ) -> None:
     """
@@ -148,7 +161,8 @@ def delete_unpacked(
     directories with the same name (without extension). If they exist
     and have identical file structures, prompts to remove the uncompressed directory.
 
-    By default, runs in interactive mode.
+    By default, runs in interactive mode and asks once for all identical
+    directories after every pair has been compared.
     """
     try:
         # Validate conflicting options
@@ -163,6 +177,7 @@ def delete_unpacked(
             never_delete=never_delete,
             include_hidden=include_hidden,
             quiet=quiet,
+            per_item_prompt=per_item_prompt,
         )
 
         # Execute check duplicates command
@@ -2,7 +2,11 @@
 Delete Unpacked Command - Removes uncompressed directories that match compressed files.
 """
 
+import json
+import os
 import shutil
+import tempfile
+from pathlib import Path
 
 from ..commons import get_logger, setup_logging
 from ..comparison import ArchiveDirectoryComparator, ComparisonResult
@@ -12,6 +16,25 @@ from ..factories.component_factory import ComponentFactory
 
 logger = get_logger()
 
+# Archive listings are cached between runs in the user's cache directory
+LISTING_CACHE_FILE = "archive_listings.json"
+
+
+def listing_cache_path() -> Path:
+    """
+    Get the path of the archive listing cache.
+
+    Follows the XDG base directory spec: $XDG_CACHE_HOME/unclutter-directory,
+    defaulting to ~/.cache/unclutter-directory.
+
+    Returns:
+        Path of the cache file (which may not exist yet)
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home) / "unclutter-directory" / LISTING_CACHE_FILE
+
 
 class DeleteUnpackedCommand:
     """Command for checking and removing duplicate directories that match compressed files."""
@@ -24,8 +47,13 @@ class DeleteUnpackedCommand:
             config: Configuration for the delete-unpacked operation
         """
         self.config = config
+        self._cache_path = listing_cache_path()
+        self._listing_cache = self._load_listing_cache()
+        # Per-file differences are only logged at INFO, which quiet mode hides
         self.comparator = ArchiveDirectoryComparator(
-            include_hidden=config.include_hidden
+            include_hidden=config.include_hidden,
+            listing_cache=self._listing_cache,
+            fast_mismatch_only=config.quiet,
         )
         self.confirmation_handler: ConfirmationHandler = (
             ComponentFactory.create_confirmation_handler(config)
@@ -55,56 +83,14 @@ class DeleteUnpackedCommand:
                 f"📦 Found {len(potential_pairs)} potential duplicates to check"
             )
 
-            # Compare each pair
-            all_results = []
-            deleted_count = 0
-
-            for archive_path, directory_path in potential_pairs:
-                logger.info(f"Comparing: {archive_path.name} ↔ {directory_path.name}")
-
-                try:
-                    # Compare archive and directory
-                    result = self.comparator.compare_archive_and_directory(
-                        archive_path, directory_path
-                    )
-
-                    if result.identical:
-                        logger.info("✅ Structures are identical")
-
-                        # Ask user if should delete the directory using confirmation handler
-                        context_info = f"directory '{directory_path.name}' (identical to '{archive_path.name}')"
-                        prompt_template = "Delete duplicate directory '{context}'? [Y(es)/N(o)/A(ll)/Never]: "
-                        cache_key = str(directory_path.parent)
-
-                        if self.confirmation_handler.should_execute(
-                            context_info=context_info,
-                            prompt_template=prompt_template,
-                            cache_key=cache_key,
-                            action_type="delete",
-                        ):
-                            # Perform the deletion directly
-                            shutil.rmtree(directory_path)
-                            deleted_count += 1
-                        else:
-                            logger.info(
-                                f"⏭️  Skipping deletion of {directory_path.name}"
-                            )
-                    else:
-                        logger.info("❌ Structures differ:")
-                        for diff in result.differences[:5]:  # Show first 5 differences
-                            logger.info(f"   • {diff}")
-                        if len(result.differences) > 5:
-                            logger.info(
-                                f"   • ... and {len(result.differences) - 5} more differences"
-                            )
-
-                    all_results.append(result)
-
-                except Exception as e:
-                    logger.error(
-                        f"❌ Error comparing {archive_path.name} with {directory_path.name}: {e}"
-                    )
-                    continue
+            if self.config.per_item_prompt:
+                all_results, deleted_count = self._process_pairs_individually(
+                    potential_pairs
+                )
+            else:
+                all_results, deleted_count = self._process_pairs_in_batch(
+                    potential_pairs
+                )
 
             # Print summary
             self._print_summary(all_results, deleted_count, len(potential_pairs))
@@ -114,6 +100,228 @@ class DeleteUnpackedCommand:
         except Exception as e:
             logger.error(f"❌ Unexpected error during check-duplicates operation: {e}")
             raise
+        finally:
+            self._save_listing_cache()
+
+    def _process_pairs_in_batch(
+        self, potential_pairs: list[tuple[Path, Path]]
+    ) -> tuple[list[ComparisonResult], int]:
+        """
+        Compare every pair first, then ask once whether to delete all the
+        directories found identical to their archives.
+
+        Args:
+            potential_pairs: Archive-directory pairs to check
+
+        Returns:
+            Tuple of (comparison results, number of directories deleted)
+        """
+        all_results = []
+        identical_pairs = []
+
+        for result in self.comparator.compare_all(potential_pairs):
+            self._log_comparison(result)
+            all_results.append(result)
+            if result.identical:
+                identical_pairs.append((result.archive_path, result.directory_path))
+
+        if not identical_pairs:
+            return all_results, 0
+
+        if len(identical_pairs) == 1:
+            archive_path, directory_path = identical_pairs[0]
+            context_info = f"directory '{directory_path.name}' (identical to '{archive_path.name}')"
+            prompt_template = (
+                "Delete duplicate directory '{context}'? [Y(es)/N(o)/A(ll)/Never]: "
+            )
+        else:
+            logger.info("🗂️  Directories identical to their archives:")
+            for archive_path, directory_path in identical_pairs:
+                logger.info(f"   • {directory_path} ↔ {archive_path.name}")
+            context_info = f"{len(identical_pairs)} duplicate directories under '{self.config.target_dir}'"
+            prompt_template = "Delete {context}? [Y(es)/N(o)/A(ll)/Never]: "
+
+        if self.confirmation_handler.should_execute(
+            context_info=context_info,
+            prompt_template=prompt_template,
+            cache_key=str(self.config.target_dir),
+            action_type="delete",
+        ):
+            deleted_count = self._delete_directories(
+                [directory_path for _, directory_path in identical_pairs]
+            )
+        else:
+            for _, directory_path in identical_pairs:
+                logger.info(f"⏭️  Skipping deletion of {directory_path.name}")
+            deleted_count = 0
+
+        return all_results, deleted_count
+
+    def _process_pairs_individually(
+        self, potential_pairs: list[tuple[Path, Path]]
+    ) -> tuple[list[ComparisonResult], int]:
+        """
+        Compare pairs one at a time, asking about each identical directory as
+        soon as its comparison finishes.
+
+        Args:
+            potential_pairs: Archive-directory pairs to check
+
+        Returns:
+            Tuple of (comparison results, number of directories deleted)
+        """
+        all_results = []
+        deleted_count = 0
+
+        for archive_path, directory_path in potential_pairs:
+            result = self._compare_pair(archive_path, directory_path)
+            if result is None:
+                continue
+            all_results.append(result)
+            if not result.identical:
+                continue
+
+            # Ask user if should delete the directory using confirmation handler
+            directory_name = directory_path.name
+            context_info = (
+                f"directory '{directory_name}' (identical to '{archive_path.name}')"
+            )
+            prompt_template = (
+                "Delete duplicate directory '{context}'? [Y(es)/N(o)/A(ll)/Never]: "
+            )
+            cache_key = str(directory_path.parent)
+
+            if self.confirmation_handler.should_execute(
+                context_info=context_info,
+                prompt_template=prompt_template,
+                cache_key=cache_key,
+                action_type="delete",
+            ):
+                deleted_count += self._delete_directories([directory_path])
+            else:
+                logger.info(f"⏭️  Skipping deletion of {directory_name}")
+
+        return all_results, deleted_count
+
+    def _compare_pair(
+        self, archive_path: Path, directory_path: Path
+    ) -> ComparisonResult | None:
+        """
+        Compare an archive with its directory and log the outcome.
+
+        Args:
+            archive_path: Path to the archive file
+            directory_path: Path to the directory to compare
+
+        Returns:
+            ComparisonResult, or None if the comparison raised an error
+        """
+        try:
+            result = self.comparator.compare_archive_and_directory(
+                archive_path, directory_path
+            )
+        except Exception as e:
+            logger.error(
+                f"❌ Error comparing {archive_path.name} with {directory_path.name}: {e}"
+            )
+            return None
+
+        self._log_comparison(result)
+        return result
+
+    def _log_comparison(self, result: ComparisonResult) -> None:
+        """
+        Log the outcome of comparing an archive with its directory.
+
+        Args:
+            result: Comparison result to report
+        """
+        logger.info(
+            f"Comparing: {result.archive_path.name} ↔ {result.directory_path.name}"
+        )
+        if result.identical:
+            logger.info("✅ Structures are identical")
+        else:
+            logger.info("❌ Structures differ:")
+            for diff in result.differences[:5]:  # Show first 5 differences
+                logger.info(f"   • {diff}")
+            if len(result.differences) > 5:
+                logger.info(
+                    f"   • ... and {len(result.differences) - 5} more differences"
+                )
+
+    def _delete_directories(self, directories: list[Path]) -> int:
+        """
+        Delete directories one after another.
+
+        A directory nested inside another one being deleted goes away with its
+        ancestor, so it is counted but not removed separately.
+
+        Args:
+            directories: Directories to delete
+
+        Returns:
+            Number of directories successfully deleted
+        """
+        deleted_count = 0
+        last_removed: Path | None = None
+        # Sorting by parts places every descendant right after its ancestor
+        for directory_path in sorted(directories, key=lambda path: path.parts):
+            if last_removed is not None and directory_path.is_relative_to(last_removed):
+                deleted_count += 1
+                continue
+            try:
+                shutil.rmtree(directory_path)
+            except OSError as e:
+                logger.error(f"❌ Failed to delete directory {directory_path}: {e}")
+                continue
+            last_removed = directory_path
+            deleted_count += 1
+        return deleted_count
+
+    def _load_listing_cache(self) -> dict:
+        """
+        Load archive listings cached by a previous run.
+
+        Returns:
+            Cached listings keyed by absolute archive path, empty if unavailable
+        """
+        try:
+            cache = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable listing cache {self._cache_path}: {e}")
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_listing_cache(self) -> None:
+        """
+        Atomically write the archive listing cache, dropping archives that no
+        longer exist.
+        """
+        cache = {
+            path: entry
+            for path, entry in self._listing_cache.items()
+            if os.path.exists(path)
+        }
+        if not cache and not self._cache_path.exists():
+            return
+
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self._cache_path.parent, prefix=LISTING_CACHE_FILE, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(cache, f)
+                os.replace(tmp_path, self._cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not write listing cache {self._cache_path}: {e}")
 
     def _print_summary(
         self, results: list[ComparisonResult], deleted_count: int, total_pairs: int
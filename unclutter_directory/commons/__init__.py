@@ -2,6 +2,7 @@ from .aliases import Rule, Rules
 from .logging import get_logger, setup_logging
 from .parsers import parse_size, parse_time
 from .validations import validate_rules_file
+from .yaml_loader import load_yaml
 
 __all__ = [
     "get_logger",
@@ -9,6 +10,7 @@ __all__ = [
     "parse_size",
     "parse_time",
     "validate_rules_file",
+    "load_yaml",
     "Rule",
     "Rules",
 ]
@@ -1,3 +1,18 @@
+from typing import TypedDict
+
+
 # Type aliases
-Rule = dict
-Rules = list[dict]
+class Rule(TypedDict, total=False):
+    """A rule as loaded from the rules file; every key is optional."""
+
+    name: str
+    description: str
+    conditions: dict
+    action: dict
+    case_sensitive: bool
+    check_archive: bool
+    is_directory: bool
+    delete_unpacked_on_match: bool
+
+
+Rules = list[Rule]
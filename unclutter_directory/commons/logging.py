@@ -3,20 +3,25 @@ import sys
 
 logger = logging.getLogger("unclutter_directory")
 
+# Shared by every handler installed by setup_logging
+_FORMATTER = logging.Formatter("%(message)s")
+
 
 def setup_logging(quiet: bool = False):
     """
-    Configure global logging based on quiet flag.
+    Configure the package logger based on quiet flag.
+
+    Safe to call repeatedly: the stdout handler is only installed once, later
+    calls just update the level.
 
     Args:
         quiet: If True, set level to ERROR; otherwise INFO
     """
-    level = logging.ERROR if quiet else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format="%(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    logger.setLevel(logging.ERROR if quiet else logging.INFO)
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(_FORMATTER)
+        logger.addHandler(handler)
 
 
 def get_logger():
@@ -1,9 +1,56 @@
-import re
+from functools import lru_cache
 
 SIZE_UNITS = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
 TIME_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
 
+# Accepted size unit spellings (upper-cased) mapped to their SIZE_UNITS key
+_SIZE_UNIT_NORM = {
+    "": "B",
+    "B": "B",
+    "K": "KB",
+    "KB": "KB",
+    "M": "MB",
+    "MB": "MB",
+    "G": "GB",
+    "GB": "GB",
+}
+# Accepted time unit spellings (lower-cased)
+_TIME_UNIT_FORMS = frozenset({"", "s", "m", "h", "d", "w"})
+
+
+def _split_number(text: str) -> tuple[str, str] | None:
+    """
+    Split a string into its leading decimal number and the trailing unit.
+
+    The number is one or more digits, optionally followed by a dot and one or
+    more digits; whitespace between the number and the unit is dropped.
+
+    Args:
+        text: Stripped input string
+
+    Returns:
+        (number, unit) tuple, or None if the string does not start with a
+        well-formed number
+    """
+    end = len(text)
+    i = 0
+    while i < end and text[i].isdecimal():
+        i += 1
+    if i == 0:
+        return None
 
+    if i < end and text[i] == ".":
+        j = i + 1
+        while j < end and text[j].isdecimal():
+            j += 1
+        if j == i + 1:
+            return None
+        i = j
+
+    return text[:i], text[i:].lstrip()
+
+
+@lru_cache(maxsize=256)
 def parse_size(size_str: str) -> int:
     """
     Parse human-readable size string to bytes.
@@ -13,7 +60,8 @@ def parse_size(size_str: str) -> int:
                   Supports units: B, KB, MB, GB (case-insensitive)
 
     Returns:
-        int: Number of bytes
+        int: Number of bytes. Results are memoized, since rules files repeat a
+        small set of size strings; invalid input raises on every call.
 
     Raises:
         ValueError: If format is invalid or unit is unknown
@@ -29,40 +77,22 @@ def parse_size(size_str: str) -> int:
         ValueError: Size parsing failed: Invalid size format: 'invalid'
     """
     try:
-        # Strip whitespace and match pattern
+        # Strip whitespace and scan "<number>[ ]<unit>"
         size_str = size_str.strip()
-        match = re.fullmatch(r"(\d+(\.\d+)?)\s*([KMG]?B?)?$", size_str, re.IGNORECASE)
+        parts = _split_number(size_str)
 
-        if not match:
+        unit = _SIZE_UNIT_NORM.get(parts[1].upper()) if parts else None
+        if unit is None:
             raise ValueError(f"Invalid size format: '{size_str}'")
 
-        groups = match.groups()
-        value_str = groups[0]
-        unit = groups[2]  # Third group contains the unit
-        value = float(value_str)
-
-        # Normalize unit
-        if unit:
-            unit = unit.upper()
-            # Handle cases like "KB", "K", "B"
-            if unit.endswith("B"):
-                unit = unit[:-1] + "B"  # "KB" -> "KB", "MB" -> "MB"
-            elif len(unit) == 1:  # Handle "K", "M", "G"
-                unit += "B"
-            else:
-                unit = "B"
-        else:
-            unit = "B"
-
-        if unit not in SIZE_UNITS:
-            raise ValueError(f"Unsupported size unit: '{unit}'")
-
+        value = float(parts[0])
         return int(value * SIZE_UNITS[unit])
 
     except (ValueError, TypeError) as e:
         raise ValueError(f"Failed to parse size '{size_str}': {str(e)}") from e
 
 
+@lru_cache(maxsize=256)
 def parse_time(time_str: str) -> int:
     """
     Parse human-readable time string to seconds.
@@ -73,7 +103,7 @@ def parse_time(time_str: str) -> int:
                   d (days), w (weeks)
 
     Returns:
-        int: Number of seconds
+        int: Number of seconds. Results are memoized like parse_size.
 
     Raises:
         ValueError: If format is invalid or unit is unknown
@@ -90,14 +120,12 @@ def parse_time(time_str: str) -> int:
     """
     try:
         time_str = time_str.strip()
-        match = re.fullmatch(r"(\d+(\.\d+)?)\s*([smhdw])?$", time_str, re.IGNORECASE)
+        parts = _split_number(time_str)
 
-        if not match:
+        if parts is None or parts[1].lower() not in _TIME_UNIT_FORMS:
             raise ValueError(f"Invalid time format: '{time_str}'")
 
-        groups = match.groups()
-        value_str = groups[0]
-        unit = groups[2]  # Third group contains the unit
+        value_str, unit = parts
         value = float(value_str)
 
         # Default to seconds if no unit
@@ -1,23 +1,61 @@
+import logging
 import re
 from typing import Any
 
 from unclutter_directory.commons.logging import logger
 from unclutter_directory.commons.parsers import parse_size, parse_time
 
-# Type aliases
-Rules = list[dict]
 # Constants for validation
-VALID_CONDITIONS = {
-    "start",
-    "end",
-    "contain",
-    "regex",
-    "larger",
-    "smaller",
-    "older",
-    "newer",
+VALID_CONDITIONS = frozenset(
+    {
+        "start",
+        "end",
+        "contain",
+        "regex",
+        "larger",
+        "smaller",
+        "older",
+        "newer",
+    }
+)
+VALID_ACTIONS = frozenset({"move", "delete", "compress"})
+# Actions that need a "target"
+_TARGET_ACTIONS = frozenset({"move", "compress"})
+# Option lists quoted in error messages, sorted so messages are deterministic
+_VALID_CONDITIONS_STR = ", ".join(sorted(VALID_CONDITIONS))
+_VALID_ACTIONS_STR = ", ".join(sorted(VALID_ACTIONS))
+# Fields every rule must define
+_REQUIRED_FIELDS = ("conditions", "action")
+# Optional boolean rule flags
+_BOOL_FIELDS = (
+    "case_sensitive",
+    "check_archive",
+    "is_directory",
+    "delete_unpacked_on_match",
+)
+# Optional text fields: (field, max length, names the rule). The name cannot
+# be empty, and its errors cite the rule number since it cannot identify itself.
+_TEXT_FIELDS = (("name", 200, True), ("description", 1000, False))
+
+# Templates for the errors that can repeat for every condition or field
+_ERR_INVALID_SIZE = "Rule {rule_id}: Invalid size value '{value}' for '{key}' - {error}"
+_ERR_INVALID_TIME = "Rule {rule_id}: Invalid time value '{value}' for '{key}' - {error}"
+_ERR_INVALID_REGEX = "Rule {rule_id}: Invalid regex pattern '{value}' - {error}"
+_ERR_INVALID_CONDITION = (
+    "Rule {rule_id}: Invalid condition '{key}' - valid options: "
+    + _VALID_CONDITIONS_STR
+)
+_ERR_EMPTY_CONDITION = "Rule {rule_id}: Condition '{key}' cannot have empty value"
+_ERR_NOT_BOOLEAN = "Rule {rule_id}: '{field}' must be boolean, got {type_name}"
+
+# Value checks per condition key: (validator, error message template)
+_COND_VALIDATORS = {
+    "larger": (parse_size, _ERR_INVALID_SIZE),
+    "smaller": (parse_size, _ERR_INVALID_SIZE),
+    "older": (parse_time, _ERR_INVALID_TIME),
+    "newer": (parse_time, _ERR_INVALID_TIME),
+    "regex": (re.compile, _ERR_INVALID_REGEX),
 }
-VALID_ACTIONS = {"move", "delete", "compress"}
 
 
 def _get_rule_identifier(rule_num: int, rule: dict) -> str:
@@ -43,59 +81,13 @@ def _get_rule_identifier(rule_num: int, rule: dict) -> str:
     return f"#{rule_num}"
 
 
-def _validate_condition(rule_num: int, key: str, value: str, rule: dict) -> list[str]:
-    """
-    Validate individual condition key-value pair.
-
-    Args:
-        rule_num: Rule number for error reporting
-        key: Condition name (start, end, contain, regex, larger, smaller, older, newer)
-        value: Condition value as string
-        rule: Rule dictionary for identifier resolution
-
-    Returns:
-        List[str]: List of validation errors (empty if valid)
-
-    Note:
-        This function validates individual condition values without checking
-        if the condition key itself is valid (that's handled elsewhere).
-    """
-    errors = []
-    rule_id = _get_rule_identifier(rule_num, rule)
-
-    if key in {"larger", "smaller"}:
-        try:
-            parse_size(value)
-        except ValueError as e:
-            errors.append(
-                f"Rule {rule_id}: Invalid size value '{value}' for '{key}' - {e}"
-            )
-
-    elif key in {"older", "newer"}:
-        try:
-            parse_time(value)
-        except ValueError as e:
-            errors.append(
-                f"Rule {rule_id}: Invalid time value '{value}' for '{key}' - {e}"
-            )
-
-    elif key == "regex":
-        try:
-            re.compile(value)
-        except re.error as e:
-            errors.append(f"Rule {rule_id}: Invalid regex pattern '{value}' - {e}")
-
-    return errors
-
-
-def _validate_action(rule_num: int, action: dict[str, Any], rule: dict) -> list[str]:
+def _validate_action(rule_id: str, action: dict[str, Any]) -> list[str]:
     """
     Validate action dictionary from a rule.
 
     Args:
-        rule_num: Rule number for error reporting
+        rule_id: Rule identifier for error reporting
         action: Action dictionary with 'type' and optional 'target'
-        rule: Rule dictionary for identifier resolution
 
     Returns:
         List[str]: List of validation errors (empty if valid)
@@ -107,16 +99,15 @@ def _validate_action(rule_num: int, action: dict[str, Any], rule: dict) -> list[
         - {"type": "compress", "target": "."}
     """
     errors = []
-    rule_id = _get_rule_identifier(rule_num, rule)
     action_type = action.get("type")
 
     if not action_type:
         errors.append(f"Rule {rule_id}: Action missing required 'type' field")
     elif action_type not in VALID_ACTIONS:
         errors.append(
-            f"Rule {rule_id}: Invalid action type '{action_type}' - valid options: {', '.join(VALID_ACTIONS)}"
+            f"Rule {rule_id}: Invalid action type '{action_type}' - valid options: {_VALID_ACTIONS_STR}"
         )
-    elif action_type in ["move", "compress"] and not action.get("target"):
+    elif action_type in _TARGET_ACTIONS and not action.get("target"):
         errors.append(
             f"Rule {rule_id}: '{action_type}' action requires 'target' parameter"
         )
@@ -129,9 +120,8 @@ def _validate_action(rule_num: int, action: dict[str, Any], rule: dict) -> list[
 
     # Validate target path safety (basic check)
     if target and isinstance(target, str):
-        if target.startswith("..") or any(
-            part in target.split("/") for part in ["../../../..", "...."]
-        ):
+        # A "...." path component, matched without splitting the path
+        if target.startswith("..") or "/..../" in f"/{target}/":
             errors.append(f"Rule {rule_id}: Target path contains suspicious patterns")
 
     return errors
@@ -180,111 +170,105 @@ def validate_rules_file(rules: list) -> list[str]:
     if not rules:
         return ["Rules file cannot be empty - at least one rule must be defined"]
 
+    # Bound once: the loop below appends many errors per rule
+    errors_append = errors.append
+    errors_extend = errors.extend
+    valid_conditions = VALID_CONDITIONS
+    cond_validators = _COND_VALIDATORS
+
     for rule_num, rule in enumerate(rules, 1):
         rule_id = _get_rule_identifier(rule_num, rule)
 
         if not isinstance(rule, dict):
-            errors.append(
+            errors_append(
                 f"Rule {rule_id}: Must be a dictionary, got {type(rule).__name__}"
             )
             continue
 
-        # Validate optional name field
-        name = rule.get("name")
-        if name is not None:
-            if not isinstance(name, str):
-                errors.append(
-                    f"Rule #{rule_num}: 'name' must be a string, got {type(name).__name__}"
+        # Validate optional name and description fields
+        for field, max_len, names_rule in _TEXT_FIELDS:
+            text = rule.get(field)
+            if text is None:
+                continue
+            label = f"#{rule_num}" if names_rule else rule_id
+            if not isinstance(text, str):
+                errors_append(
+                    f"Rule {label}: '{field}' must be a string, got {type(text).__name__}"
                 )
-            elif len(name.strip()) == 0:
-                errors.append(f"Rule #{rule_num}: 'name' cannot be empty")
-            elif len(name) > 200:
-                errors.append(
-                    f"Rule #{rule_num}: 'name' too long ({len(name)} chars, max 200)"
+            elif names_rule and len(text.strip()) == 0:
+                errors_append(f"Rule {label}: '{field}' cannot be empty")
+            elif len(text) > max_len:
+                errors_append(
+                    f"Rule {label}: '{field}' too long ({len(text)} chars, max {max_len})"
                 )
 
-        # Validate optional description field
-        description = rule.get("description")
-        if description is not None:
-            if not isinstance(description, str):
-                errors.append(
-                    f"Rule {rule_id}: 'description' must be a string, got {type(description).__name__}"
-                )
-            elif len(description) > 1000:
-                errors.append(
-                    f"Rule {rule_id}: 'description' too long ({len(description)} chars, max 1000)"
+        # Validate optional boolean flags
+        for field in _BOOL_FIELDS:
+            value = rule.get(field)
+            if value is not None and not isinstance(value, bool):
+                errors_append(
+                    _ERR_NOT_BOOLEAN.format(
+                        rule_id=rule_id, field=field, type_name=type(value).__name__
+                    )
                 )
 
+        # Skip the condition and action walks for incomplete rules
+        missing = [field for field in _REQUIRED_FIELDS if field not in rule]
+        if missing:
+            errors_append(
+                f"Rule {rule_id}: Missing required field(s): {', '.join(missing)}"
+            )
+            continue
+
         # Validate conditions
-        conditions = rule.get("conditions", {})
+        conditions = rule["conditions"]
         if not isinstance(conditions, dict):
-            errors.append(
+            errors_append(
                 f"Rule {rule_id}: 'conditions' must be a dictionary, got {type(conditions).__name__}"
             )
             continue
 
         if not conditions:
-            errors.append(f"Rule {rule_id}: Rule must contain at least one condition")
+            errors_append(f"Rule {rule_id}: Rule must contain at least one condition")
 
         for key, value in conditions.items():
-            if key not in VALID_CONDITIONS:
-                errors.append(
-                    f"Rule {rule_id}: Invalid condition '{key}' - valid options: {', '.join(VALID_CONDITIONS)}"
-                )
+            # One lookup both recognizes the key and finds its value check
+            validator = cond_validators.get(key)
+            if validator is None and key not in valid_conditions:
+                errors_append(_ERR_INVALID_CONDITION.format(rule_id=rule_id, key=key))
                 continue
 
             if value is None or value == "":
-                errors.append(
-                    f"Rule {rule_id}: Condition '{key}' cannot have empty value"
-                )
+                errors_append(_ERR_EMPTY_CONDITION.format(rule_id=rule_id, key=key))
                 continue
 
-            errors.extend(_validate_condition(rule_num, key, value, rule))
+            if validator is None:
+                continue
 
-        # Validate case_sensitive
-        case_sensitive = rule.get("case_sensitive")
-        if case_sensitive is not None and not isinstance(case_sensitive, bool):
-            errors.append(
-                f"Rule {rule_id}: 'case_sensitive' must be boolean, got {type(case_sensitive).__name__}"
-            )
+            check, message = validator
+            try:
+                check(value)
+            except (ValueError, re.error) as e:
+                errors_append(
+                    message.format(rule_id=rule_id, key=key, value=value, error=e)
+                )
 
         # Validate action
-        action = rule.get("action")
+        action = rule["action"]
         if not action:
-            errors.append(f"Rule {rule_id}: Rule must contain 'action' field")
+            errors_append(f"Rule {rule_id}: Rule must contain 'action' field")
         elif not isinstance(action, dict):
-            errors.append(
+            errors_append(
                 f"Rule {rule_id}: 'action' must be a dictionary, got {type(action).__name__}"
             )
         else:
-            errors.extend(_validate_action(rule_num, action, rule))
-
-        # Validate check_archive
-        check_archive = rule.get("check_archive")
-        if check_archive is not None and not isinstance(check_archive, bool):
-            errors.append(
-                f"Rule {rule_id}: 'check_archive' must be boolean, got {type(check_archive).__name__}"
-            )
-
-        # Validate is_directory
-        is_directory = rule.get("is_directory")
-        if is_directory is not None and not isinstance(is_directory, bool):
-            errors.append(
-                f"Rule {rule_id}: 'is_directory' must be boolean, got {type(is_directory).__name__}"
-            )
-
-        # Validate delete_unpacked_on_match
-        delete_unpacked_on_match = rule.get("delete_unpacked_on_match")
-        if delete_unpacked_on_match is not None and not isinstance(
-            delete_unpacked_on_match, bool
-        ):
-            errors.append(
-                f"Rule {rule_id}: 'delete_unpacked_on_match' must be boolean, got {type(delete_unpacked_on_match).__name__}"
-            )
+            errors_extend(_validate_action(rule_id, action))
 
-    if errors:
-        logger.error("Rules validation failed with %d errors:", len(errors))
-        for error in errors:
-            logger.error("• %s", error)
+    if errors and logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "Rules validation failed with %d errors:\n%s",
+            len(errors),
+            "\n".join(f"• {error}" for error in errors),
+        )
 
     return errors
@@ -0,0 +1,21 @@
+import yaml
+
+# LibYAML's C loader is much faster on large rules files; fall back to the
+# pure-Python loader when PyYAML was built without it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(stream):
+    """
+    Safely load a YAML document, using the LibYAML bindings when available.
+
+    Args:
+        stream: YAML text or an open text stream
+
+    Returns:
+        The loaded Python object
+
+    Raises:
+        yaml.YAMLError: If the document is not valid YAML
+    """
+    return yaml.load(stream, Loader=SafeLoader)
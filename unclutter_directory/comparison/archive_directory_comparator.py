@@ -2,8 +2,16 @@
 Archive Directory Comparator - Compares compressed files with their corresponding directories.
 """
 
+import heapq
+import logging
 import os
+import queue
+import threading
 import unicodedata
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import cache, lru_cache
 from pathlib import Path
 
 from ..commons import get_logger
@@ -13,6 +21,102 @@ from .directory_analyzer import DirectoryAnalyzer
 
 logger = get_logger()
 
+# Parallel discovery only pays off when the root fans out into enough subdirectories
+PARALLEL_SCAN_THRESHOLD = 4
+PARALLEL_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+# Worker processes are only started for at least this many archives whose
+# listing is not cached. Each pair is a few milliseconds of work, while the pool
+# costs process start-up plus pickling every result back, so smaller batches
+# (and any batch on a single CPU) are compared faster in-process.
+PARALLEL_COMPARE_THRESHOLD = 32
+# Missing/extra paths listed individually per comparison; the rest are counted
+MAX_REPORTED_PATHS = 50
+
+# Comparator owned by each compare_all worker process, and the records it logged
+_worker_comparator = None
+_worker_log_records: list[logging.LogRecord] = []
+
+
+class _RecordCollector(logging.Handler):
+    """Keep a worker's log records so the parent process can emit them."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Format now: the record's args may not survive pickling
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        _worker_log_records.append(record)
+
+
+def _init_compare_worker(
+    include_hidden: bool, fast_mismatch_only: bool, log_level: int
+) -> None:
+    """
+    Set up a compare_all worker process.
+
+    The worker gets its own empty listing cache; it only compares archives the
+    parent has no cached listing for. Log records are collected instead of
+    written, since the worker has no handlers under spawn/forkserver and would
+    duplicate the parent's under fork.
+    """
+    global _worker_comparator
+    _worker_comparator = ArchiveDirectoryComparator(
+        include_hidden=include_hidden,
+        listing_cache={},
+        fast_mismatch_only=fast_mismatch_only,
+    )
+    logger.handlers[:] = [_RecordCollector()]
+    logger.propagate = False
+    logger.setLevel(log_level)
+
+
+def _compare_in_worker(
+    pair: tuple[Path, Path],
+) -> tuple["ComparisonResult", dict | None, list[logging.LogRecord]]:
+    """
+    Compare one pair in a compare_all worker process.
+
+    Returns:
+        The comparison result, the archive's listing cache entry (or None) so
+        the parent can keep listings read by its workers, and the log records
+        emitted during the comparison
+    """
+    archive_path, directory_path = pair
+    _worker_log_records.clear()
+    result = _worker_comparator.compare_archive_and_directory(
+        archive_path, directory_path
+    )
+    entry = _worker_comparator.listing_cache.pop(os.path.abspath(archive_path), None)
+    return result, entry, list(_worker_log_records)
+
+
+@lru_cache(maxsize=65536)
+def _nfc(text: str) -> str:
+    """
+    NFC-normalize a name. Archive entries share directory prefixes and each
+    name is normalized more than once per comparison, so results are cached.
+    """
+    return unicodedata.normalize("NFC", text)
+
+
+@cache
+def _suffix_is_archive(suffix: str) -> bool:
+    """
+    Check whether files with a (lowercased) extension are supported archives.
+
+    Archive handlers decide on the file extension alone, so the handler chain
+    only needs to run once per distinct extension seen during a scan.
+
+    Args:
+        suffix: Lowercased extension including the dot (e.g. ".zip"), or ""
+
+    Returns:
+        True if an archive manager handles files with this extension
+    """
+    if not suffix:
+        return False
+    return get_archive_manager(File(Path("."), "archive" + suffix, 0, 0)) is not None
+
 
 class ComparisonResult:
     """Result of comparing an archive with its corresponding directory."""
@@ -44,14 +148,25 @@ class ArchiveDirectoryComparator:
     to determine if they contain identical file structures.
     """
 
-    def __init__(self, include_hidden: bool = False):
+    def __init__(
+        self,
+        include_hidden: bool = False,
+        listing_cache: dict | None = None,
+        fast_mismatch_only: bool = False,
+    ):
         """
         Initialize comparator instance
 
         Args:
             include_hidden: Whether to include hidden files in comparison
+            listing_cache: Optional mapping of absolute archive paths to their cached
+                listings, reused while the archive's mtime and size are unchanged
+            fast_mismatch_only: If True, differing structures are reported with a
+                single summary difference instead of a full per-file diff
         """
         self.include_hidden = include_hidden
+        self.listing_cache = listing_cache
+        self.fast_mismatch_only = fast_mismatch_only
         self.directory_analyzer = DirectoryAnalyzer(include_hidden=include_hidden)
 
     def _normalize_unicode(self, text: str) -> str:
@@ -64,7 +179,8 @@ class ArchiveDirectoryComparator:
         Returns:
             Normalized text using NFC (Canonical Decomposition, followed by Canonical Composition)
         """
-        return unicodedata.normalize("NFC", text)
+        # NFC is the identity on ASCII, which covers most archive entries
+        return text if text.isascii() else _nfc(text)
 
     def find_potential_duplicates(self, target_dir: Path) -> list[tuple[Path, Path]]:
         """
@@ -76,48 +192,153 @@ class ArchiveDirectoryComparator:
         Returns:
             List of tuples (archive_path, directory_path) where directory might be duplicate of archive
         """
-        potential_duplicates = []
+        potential_duplicates = list(self.iter_potential_duplicates(target_dir))
 
-        try:
-            # Walk through all files in target directory
-            for root, _dirs, files in os.walk(target_dir):
-                root_path = Path(root)
+        logger.info(
+            f"Found {len(potential_duplicates)} potential archive-directory pairs for comparison"
+        )
+        return potential_duplicates
 
-                for file_name in files:
-                    file_path = root_path / file_name
+    def iter_potential_duplicates(
+        self, target_dir: Path
+    ) -> Iterator[tuple[Path, Path]]:
+        """
+        Yield potential archive-directory duplicates in target directory.
 
-                    # Check if it's a supported archive file
-                    archive_file = File.from_path(file_path)
-                    if get_archive_manager(archive_file):
-                        # Extract directory name (remove extension)
-                        dir_name = file_path.stem
+        On narrow trees the directory walk is streamed, so pairs are yielded as
+        they are found instead of being collected first. Wide trees are scanned
+        in parallel and their pairs are yielded once the scan has finished.
 
-                        # Check if corresponding directory exists
-                        expected_dir_path = file_path.parent / dir_name
-                        if expected_dir_path.exists() and expected_dir_path.is_dir():
-                            potential_duplicates.append((file_path, expected_dir_path))
+        Args:
+            target_dir: Directory to scan for archives and corresponding directories
+
+        Yields:
+            Tuples (archive_path, directory_path) where directory might be duplicate of archive
+        """
+        try:
+            if self._count_subdirectories(target_dir) > PARALLEL_SCAN_THRESHOLD:
+                yield from self._parallel_scan(target_dir)
+                return
+
+            # Walk through all files in target directory
+            for root, dirs, files in os.walk(target_dir):
+                dir_names = set(dirs)
+                for file_name in files:
+                    pair = self._find_pair(root, file_name, dir_names)
+                    if pair:
+                        yield pair
 
         except OSError as e:
             logger.error(f"Error scanning directory {target_dir}: {e}")
 
-        logger.info(
-            f"Found {len(potential_duplicates)} potential archive-directory pairs for comparison"
-        )
-        return potential_duplicates
+    def _find_pair(
+        self, root: str, file_name: str, dir_names: set[str]
+    ) -> tuple[Path, Path] | None:
+        """
+        Build an archive-directory pair for a file if it is a supported archive
+        with a sibling directory named after it.
+
+        Paths are handled as plain strings while scanning; Path objects are only
+        created for the pairs that are actually returned.
+
+        Args:
+            root: Directory containing the file
+            file_name: Name of the file to check
+            dir_names: Names of the subdirectories of root, from the listing
+                that produced file_name
 
-    def _strip_directory_prefix(self, file: File, expected_dir_name: str) -> File:
+        Returns:
+            Tuple (archive_path, directory_path) or None if the file is not a candidate
+        """
+        # Check if it's a supported archive file
+        stem, suffix = os.path.splitext(file_name)
+        if not _suffix_is_archive(suffix.lower()):
+            return None
+
+        # Check if corresponding directory exists (directory name is the stem)
+        if stem in dir_names:
+            return Path(root, file_name), Path(root, stem)
+        return None
+
+    def _count_subdirectories(self, directory: str | Path) -> int:
+        """Count the immediate subdirectories of a directory."""
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries if entry.is_dir())
+
+    def _parallel_scan(self, root: str | Path) -> list[tuple[Path, Path]]:
+        """
+        Discover archive-directory pairs using a pool of threads sharing a queue
+        of pending directories.
+
+        Each worker pops a directory, scans it, records the pairs it finds and
+        pushes its subdirectories back onto the queue, so idle workers pick up
+        work from whichever branch of the tree is still being explored.
+        Symlinked directories are not followed, matching ``os.walk``.
+
+        Args:
+            root: Directory to scan
+
+        Returns:
+            List of (archive_path, directory_path) tuples sorted by archive path
+        """
+        pending: queue.Queue[str | None] = queue.Queue()
+        pairs: list[tuple[Path, Path]] = []
+        pairs_lock = threading.Lock()
+
+        def worker() -> None:
+            while True:
+                directory = pending.get()
+                if directory is None:
+                    pending.task_done()
+                    return
+                try:
+                    dir_names = set()
+                    file_names = []
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.is_dir():
+                                dir_names.add(entry.name)
+                                if not entry.is_symlink():
+                                    pending.put(entry.path)
+                            else:
+                                file_names.append(entry.name)
+                    found = []
+                    for file_name in file_names:
+                        pair = self._find_pair(directory, file_name, dir_names)
+                        if pair:
+                            found.append(pair)
+                    if found:
+                        with pairs_lock:
+                            pairs.extend(found)
+                except OSError as e:
+                    logger.debug(f"Could not scan directory {directory}: {e}")
+                except Exception as e:
+                    logger.error(f"Error scanning directory {directory}: {e}")
+                finally:
+                    pending.task_done()
+
+        pending.put(os.fspath(root))
+        with ThreadPoolExecutor(max_workers=PARALLEL_SCAN_WORKERS) as executor:
+            for _ in range(PARALLEL_SCAN_WORKERS):
+                executor.submit(worker)
+            pending.join()
+            for _ in range(PARALLEL_SCAN_WORKERS):
+                pending.put(None)
+
+        return sorted(pairs)
+
+    def _strip_directory_prefix(self, file: File, expected_prefix: str) -> File:
         """
         Strip the directory prefix from a file path if it matches the expected directory name.
 
         Args:
             file: File to process
-            expected_dir_name: Expected directory name to strip
+            expected_prefix: Normalized expected directory name followed by "/"
 
         Returns:
             File with stripped prefix or original file if no prefix matches
         """
         normalized_name = self._normalize_unicode(file.name)
-        expected_prefix = self._normalize_unicode(expected_dir_name) + "/"
 
         # Check if this is the root directory entry (should be filtered out)
         if normalized_name == expected_prefix:
@@ -159,25 +380,36 @@ class ArchiveDirectoryComparator:
                     [f"Unsupported archive format: {archive_path.suffix}"],
                 )
 
-            # Get files from archive and directory
-            archive_files = archive_manager.get_files(File.from_path(archive_path))
+            # Read the archive first: an empty listing (usually an unreadable
+            # archive) cannot prove the directory is a duplicate, so the
+            # directory walk is skipped
+            archive_files = self._get_archive_files(archive_manager, archive_path)
+            if not archive_files:
+                return ComparisonResult(
+                    archive_path,
+                    directory_path,
+                    False,
+                    [],
+                    [],
+                    ["Archive is empty or could not be read"],
+                )
+
             directory_files = self.directory_analyzer.get_files(directory_path)
 
             # Extract and normalize the expected directory name from the archive filename
             expected_dir_name = archive_path.stem
+            expected_prefix = self._normalize_unicode(expected_dir_name) + "/"
 
-            # Process archive files to normalize paths and strip directory prefix
+            # Process archive files to normalize paths and strip directory prefix,
+            # noting whether the archive contains subdirectory entries
             processed_archive_files = []
+            original_archive_has_directories = False
             for file in archive_files:
-                processed_file = self._strip_directory_prefix(file, expected_dir_name)
+                processed_file = self._strip_directory_prefix(file, expected_prefix)
                 if processed_file is not None:  # Filter out root directory entries
                     processed_archive_files.append(processed_file)
-
-            # Check if the archive originally contained subdirectory entries
-            original_archive_has_directories = any(
-                f.name.endswith("/") and not f.name == (expected_dir_name + "/")
-                for f in archive_files
-            )
+                    if file.name.endswith("/"):
+                        original_archive_has_directories = True
 
             # If archive doesn't have subdirectories, filter them out from directory files
             if not original_archive_has_directories:
@@ -213,6 +445,146 @@ class ArchiveDirectoryComparator:
                 [f"Comparison failed: {str(e)}"],
             )
 
+    def compare_all(
+        self, pairs: list[tuple[Path, Path]], max_workers: int | None = None
+    ) -> list[ComparisonResult]:
+        """
+        Compare several archive-directory pairs, using a process pool for the
+        archives that must be read when there are enough of them to pay off.
+
+        Pairs whose archive listing is cached are compared in-process, since
+        they only need a directory walk. Listings read by the worker processes
+        are merged back into the listing cache, and their log records are
+        emitted here. If a process pool cannot be used, the pairs are compared
+        serially.
+
+        Args:
+            pairs: (archive_path, directory_path) tuples to compare
+            max_workers: Number of worker processes (defaults to the CPU count)
+
+        Returns:
+            List of ComparisonResult objects, in the same order as pairs
+        """
+        workers = max_workers or os.cpu_count() or 1
+        uncached = [i for i, (a, _) in enumerate(pairs) if not self._is_cached(a)]
+        if workers <= 1 or len(uncached) < PARALLEL_COMPARE_THRESHOLD:
+            return [self.compare_archive_and_directory(a, d) for a, d in pairs]
+
+        uncached_pairs = [pairs[i] for i in uncached]
+        chunksize = max(1, len(uncached_pairs) // (4 * workers))
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_compare_worker,
+                initargs=(
+                    self.include_hidden,
+                    self.fast_mismatch_only,
+                    logger.getEffectiveLevel(),
+                ),
+            ) as executor:
+                outcomes = list(
+                    executor.map(
+                        _compare_in_worker, uncached_pairs, chunksize=chunksize
+                    )
+                )
+        except (OSError, BrokenProcessPool) as e:
+            logger.debug(f"Parallel comparison unavailable, comparing serially: {e}")
+            return [self.compare_archive_and_directory(a, d) for a, d in pairs]
+
+        results: list[ComparisonResult | None] = [None] * len(pairs)
+        for i, (result, entry, records) in zip(uncached, outcomes, strict=True):
+            for record in records:
+                logger.handle(record)
+            results[i] = result
+            if entry is not None and self.listing_cache is not None:
+                self.listing_cache[os.path.abspath(pairs[i][0])] = entry
+        for i, (archive_path, directory_path) in enumerate(pairs):
+            if results[i] is None:
+                results[i] = self.compare_archive_and_directory(
+                    archive_path, directory_path
+                )
+        return results
+
+    def _is_cached(self, archive_path: Path) -> bool:
+        """
+        Check whether the listing cache holds a current listing for an archive.
+
+        Args:
+            archive_path: Path to the archive file
+
+        Returns:
+            True if the cached entry's modification time and size still match
+        """
+        if not self.listing_cache:
+            return False
+        entry = self.listing_cache.get(os.path.abspath(archive_path))
+        if not isinstance(entry, dict):
+            return False
+        try:
+            stat = os.stat(archive_path)
+        except OSError:
+            return False
+        return (
+            entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+        )
+
+    def _get_archive_files(self, archive_manager, archive_path: Path) -> list[File]:
+        """
+        Get the files listed in an archive, using the listing cache when possible.
+
+        A cached listing is only reused if the archive's modification time and size
+        still match the ones recorded with it; otherwise the archive is read again
+        and the cache entry replaced. Empty listings are never cached, since they
+        usually mean the archive could not be read.
+
+        Args:
+            archive_manager: Archive manager able to read the archive
+            archive_path: Path to the archive file
+
+        Returns:
+            List of File objects contained in the archive
+        """
+        if self.listing_cache is None:
+            return archive_manager.get_files(File.from_path(archive_path))
+
+        key = os.path.abspath(archive_path)
+        stat = os.stat(archive_path)
+        entry = self.listing_cache.get(key)
+        if (
+            isinstance(entry, dict)
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+        ):
+            # One shared parent Path for every entry, as the archive managers do
+            parent = archive_path.parent
+            try:
+                cached_files = []
+                for name, date, size in entry["files"]:
+                    if not isinstance(name, str):
+                        raise TypeError(f"invalid file name {name!r}")
+                    cached_files.append(File(parent, name, date, size))
+                return cached_files
+            except (KeyError, TypeError, ValueError) as e:
+                # A malformed entry is ignored and replaced by a fresh listing
+                logger.debug(f"Ignoring malformed listing cache entry for {key}: {e}")
+
+        archive_files = archive_manager.get_files(File.from_path(archive_path))
+        if archive_files:
+            self.listing_cache[key] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "files": [
+                    [
+                        f.name,
+                        f.date if isinstance(f.date, int | float) else None,
+                        f.size,
+                    ]
+                    for f in archive_files
+                ],
+            }
+        return archive_files
+
     def _get_archive_manager(self, archive_path: Path):
         """
         Get the appropriate archive manager for a file.
@@ -245,50 +617,78 @@ class ArchiveDirectoryComparator:
         """
         differences = []
 
-        # Create normalized mappings for efficient lookup
-        normalized_archive_files = {
-            self._normalize_unicode(file.name): file for file in archive_files
-        }
-        normalized_directory_files = {
-            self._normalize_unicode(file.name): file for file in directory_files
-        }
-
-        # Create sets of normalized file paths for comparison
-        archive_paths = set(normalized_archive_files.keys())
-        directory_paths = set(normalized_directory_files.keys())
+        # Only names and sizes take part in the diff, so map normalized names
+        # straight to sizes instead of keeping the File objects around
+        normalize = self._normalize_unicode
+        archive_sizes = {normalize(file.name): file.size for file in archive_files}
+        directory_sizes = {normalize(file.name): file.size for file in directory_files}
+
+        # Key views support set operations without copying the keys
+        archive_paths = archive_sizes.keys()
+        directory_paths = directory_sizes.keys()
+
+        # Reject on count or name mismatch before building the detailed diff
+        if self.fast_mismatch_only:
+            if len(archive_paths) != len(directory_paths):
+                return [
+                    f"File count mismatch: archive={len(archive_paths)}, "
+                    f"directory={len(directory_paths)}"
+                ]
+            if archive_paths != directory_paths:
+                return ["File names differ between archive and directory"]
+
+        # One symmetric difference, partitioned by a membership check, gives
+        # both the files missing from the directory and the extra ones
+        missing_in_directory = set()
+        extra_in_directory = set()
+        for path in archive_paths ^ directory_paths:
+            if path in archive_sizes:
+                missing_in_directory.add(path)
+            else:
+                extra_in_directory.add(path)
 
-        # Find files that are in archive but not in directory
-        missing_in_directory = archive_paths - directory_paths
         if missing_in_directory:
             differences.extend(
-                [
-                    f"Missing in directory: {path}"
-                    for path in sorted(missing_in_directory)
-                ]
+                self._report_paths("Missing in directory", missing_in_directory)
             )
-
-        # Find files that are in directory but not in archive
-        extra_in_directory = directory_paths - archive_paths
         if extra_in_directory:
             differences.extend(
-                [f"Extra in directory: {path}" for path in sorted(extra_in_directory)]
+                self._report_paths("Extra in directory", extra_in_directory)
             )
 
-        # Compare file sizes for common files
-        common_files = archive_paths & directory_paths
-        for normalized_path in common_files:
-            archive_file = normalized_archive_files[normalized_path]
-            directory_file = normalized_directory_files[normalized_path]
-
-            # Compare sizes
-            if archive_file.size != directory_file.size:
+        # Compare sizes of common files, probing the larger map from the smaller
+        smaller, larger = archive_sizes, directory_sizes
+        if len(smaller) > len(larger):
+            smaller, larger = larger, smaller
+        for normalized_path, size in smaller.items():
+            if normalized_path in larger and larger[normalized_path] != size:
                 differences.append(
                     f"Size mismatch for {normalized_path}: "
-                    f"archive={archive_file.size}, directory={directory_file.size}"
+                    f"archive={archive_sizes[normalized_path]}, "
+                    f"directory={directory_sizes[normalized_path]}"
                 )
 
         return differences
 
+    def _report_paths(self, label: str, paths: set[str]) -> list[str]:
+        """
+        Format the first MAX_REPORTED_PATHS paths (in sorted order) as
+        differences, summarizing the rest in one line.
+
+        Args:
+            label: Kind of difference, e.g. "Missing in directory"
+            paths: Paths with that difference
+
+        Returns:
+            List of difference messages
+        """
+        reported = [
+            f"{label}: {path}" for path in heapq.nsmallest(MAX_REPORTED_PATHS, paths)
+        ]
+        if len(paths) > MAX_REPORTED_PATHS:
+            reported.append(f"{label}: ... and {len(paths) - MAX_REPORTED_PATHS} more")
+        return reported
+
     def get_comparison_summary(self, results: list[ComparisonResult]) -> dict:
         """
         Generate summary statistics from comparison results.
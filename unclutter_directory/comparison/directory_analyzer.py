@@ -3,6 +3,7 @@ Directory analysis utility for comparing directory structures with compressed ar
 """
 
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 from ..commons import get_logger
@@ -10,6 +11,14 @@ from ..entities.file import File
 
 logger = get_logger()
 
+# Entries listed serially before the rest of the tree is handed to threads
+PARALLEL_ANALYSIS_THRESHOLD = 1000
+PARALLEL_ANALYSIS_WORKERS = 16
+
+# A directory waiting to be listed: (path, path relative to the analyzed
+# directory, DirEntry it was found through or None for the root)
+_PendingDir = tuple[str, str, os.DirEntry | None]
+
 
 class DirectoryAnalyzer:
     """
@@ -29,6 +38,11 @@ class DirectoryAnalyzer:
         """
         Get all files in a directory, similar to how CompressedArchive.get_files() works.
 
+        Small trees are listed serially. Once more than PARALLEL_ANALYSIS_THRESHOLD
+        entries have been seen, the directories still to list are handed to a
+        thread pool (listing and stat calls release the GIL). Either way the
+        result is in the order of a top-down os.walk.
+
         Args:
             directory_path: Path to the directory to analyze
 
@@ -39,73 +53,145 @@ class DirectoryAnalyzer:
             logger.error(f"Path is not a directory: {directory_path}")
             return []
 
-        try:
-            all_files = []
-            # Walk through all files in the directory tree
-            for root, dirs, files in os.walk(directory_path):
-                root_path = Path(root)
-
-                # Filter hidden directories if not included
-                if not self.include_hidden:
-                    dirs[:] = [d for d in dirs if not d.startswith(".")]
-
-                # Create relative path for current directory
-                relative_root = root_path.relative_to(directory_path)
-
-                # Add directory entries (similar to how ZIP stores them)
-                # But skip the root directory itself (empty relative path)
-                if str(relative_root) != ".":
-                    try:
-                        # Get directory stats
-                        stat = root_path.stat()
-
-                        # Create File object for directory
-                        dir_obj = File(
-                            path=root_path.parent,  # Parent of the directory
-                            name=str(relative_root)
-                            + "/",  # Directory name with trailing slash
-                            date=int(stat.st_mtime),  # Modification time
-                            size=0,  # Directories have size 0 in ZIP format
-                        )
-
-                        all_files.append(dir_obj)
-                    except OSError as e:
-                        logger.warning(f"Could not access directory {root_path}: {e}")
-
-                # Process each file
-                for file_name in files:
-                    # Skip hidden files if not included
-                    if not self.include_hidden and file_name.startswith("."):
-                        continue
-
-                    file_path = root_path / file_name
-
-                    try:
-                        # Get file stats
-                        stat = file_path.stat()
-
-                        # Create relative path for comparison (similar to zip namelist format)
-                        relative_path = file_path.relative_to(directory_path)
-
-                        # Create File object
-                        file_obj = File(
-                            path=root_path,  # Parent directory
-                            name=str(relative_path),  # Relative path as filename
-                            date=int(stat.st_mtime),  # Modification time
-                            size=stat.st_size,  # File size
-                        )
-
-                        all_files.append(file_obj)
+        # Listing of each scanned directory, keyed by its relative path:
+        # (its File entries, relative paths of the subdirectories to descend into)
+        listings: dict[str, tuple[list[File], list[str]]] = {}
+        # Directories still to list, popped depth-first in listing order
+        pending: list[_PendingDir] = [(os.fspath(directory_path), "", None)]
+        seen = 0
+
+        while pending and seen <= PARALLEL_ANALYSIS_THRESHOLD:
+            dir_path, relative_dir, dir_entry = pending.pop()
+            listing = self._scan_directory(dir_path, relative_dir, dir_entry)
+            if listing is None:
+                continue
+            files, subdirs = listing
+            listings[relative_dir] = (files, [sub[1] for sub in subdirs])
+            seen += len(files) + len(subdirs)
+            pending.extend(reversed(subdirs))
+
+        if pending:
+            self._scan_in_parallel(pending, listings)
+
+        # Assemble the listings in top-down walk order
+        all_files = []
+        order = [""]
+        while order:
+            listing = listings.get(order.pop())
+            if listing is None:
+                continue
+            files, children = listing
+            all_files.extend(files)
+            order.extend(reversed(children))
+
+        return all_files
+
+    def _scan_in_parallel(
+        self,
+        pending: list[_PendingDir],
+        listings: dict[str, tuple[list[File], list[str]]],
+    ) -> None:
+        """
+        List the pending directories and all their descendants on a thread pool.
 
-                    except OSError as e:
-                        logger.warning(f"Could not access file {file_path}: {e}")
+        Args:
+            pending: Directories still to list
+            listings: Listings by relative path, filled in place
+        """
+        with ThreadPoolExecutor(max_workers=PARALLEL_ANALYSIS_WORKERS) as executor:
+            futures = {
+                executor.submit(self._scan_directory, *item): item[1]
+                for item in pending
+            }
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    relative_dir = futures.pop(future)
+                    listing = future.result()
+                    if listing is None:
                         continue
+                    files, subdirs = listing
+                    listings[relative_dir] = (files, [sub[1] for sub in subdirs])
+                    for item in subdirs:
+                        futures[executor.submit(self._scan_directory, *item)] = item[1]
+
+    def _scan_directory(
+        self, dir_path: str, relative_dir: str, dir_entry: os.DirEntry | None
+    ) -> tuple[list[File], list[_PendingDir]] | None:
+        """
+        List one directory.
 
-            return all_files
+        Args:
+            dir_path: Directory to list
+            relative_dir: Its path relative to the analyzed directory ("" for the root)
+            dir_entry: DirEntry the directory was found through (None for the root)
 
+        Returns:
+            Tuple of (File entries for the directory itself and its files,
+            subdirectories to descend into), or None if it cannot be listed
+        """
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
         except OSError as e:
-            logger.error(f"Error analyzing directory {directory_path}: {e}")
-            return []
+            logger.warning(f"Could not access directory {dir_path}: {e}")
+            return None
+
+        root_path = Path(dir_path)
+        files = []
+
+        # Add directory entries (similar to how ZIP stores them)
+        # But skip the root directory itself (empty relative path)
+        if dir_entry is not None:
+            try:
+                stat = dir_entry.stat()
+                files.append(
+                    File(
+                        path=root_path.parent,  # Parent of the directory
+                        name=relative_dir + "/",  # Trailing slash like ZIP
+                        date=int(stat.st_mtime),  # Modification time
+                        size=0,  # Directories have size 0 in ZIP format
+                    )
+                )
+            except OSError as e:
+                logger.warning(f"Could not access directory {root_path}: {e}")
+
+        prefix = relative_dir + os.sep if relative_dir else ""
+        subdirs = []
+
+        for entry in entries:
+            name = entry.name
+            # Skip hidden files and directories if not included
+            if not self.include_hidden and name.startswith("."):
+                continue
+
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                # Like os.walk, symlinked directories are not followed
+                if not entry.is_symlink():
+                    subdirs.append((entry.path, prefix + name, entry))
+                continue
+
+            try:
+                stat = entry.stat()
+            except OSError as e:
+                logger.warning(f"Could not access file {entry.path}: {e}")
+                continue
+
+            files.append(
+                File(
+                    path=root_path,  # Parent directory
+                    name=prefix + name,  # Relative path as filename
+                    date=int(stat.st_mtime),  # Modification time
+                    size=stat.st_size,  # File size
+                )
+            )
+
+        return files, subdirs
 
     def get_file_list(self, directory_path: Path) -> list[str]:
         """
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import stat
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 from ..commons import get_logger
@@ -22,18 +24,20 @@ class DeleteUnpackedConfig:
     never_delete: bool = False
     include_hidden: bool = False
     quiet: bool = False
-    _target_dir_path: Path | None = field(init=False, default=None)
+    per_item_prompt: bool = False
 
     def __post_init__(self):
         """Validate configuration after initialization"""
         errors = []
 
-        # Validate target directory
-        if not self.target_dir.exists():
+        # Validate target directory with a single stat call
+        try:
+            target_mode = self.target_dir.stat().st_mode
+        except OSError:
             errors.append(f"Target directory does not exist: {self.target_dir}")
-
-        if not self.target_dir.is_dir():
-            errors.append(f"Target path is not a directory: {self.target_dir}")
+        else:
+            if not stat.S_ISDIR(target_mode):
+                errors.append(f"Target path is not a directory: {self.target_dir}")
 
         # Validate conflicting flags
         if self.always_delete and self.never_delete:
@@ -55,12 +59,10 @@ class DeleteUnpackedConfig:
         else:
             return ExecutionMode.INTERACTIVE
 
-    @property
+    @cached_property
     def target_dir_path(self) -> Path:
         """Get the resolved target directory path"""
-        if self._target_dir_path is None:
-            self._target_dir_path = self.target_dir.resolve()
-        return self._target_dir_path
+        return self.target_dir.resolve()
 
     def should_interactive_prompt(self) -> bool:
         """
@@ -78,11 +80,7 @@ class DeleteUnpackedConfig:
         Returns:
             True if directories should be deleted, False otherwise
         """
-        if self.never_delete:
-            return False
-        if self.always_delete:
-            return True
-        return False  # Default to not delete
+        return self.always_delete and not self.never_delete
 
     def __str__(self) -> str:
         """String representation for logging"""
@@ -95,6 +93,8 @@ class DeleteUnpackedConfig:
             flags.append("include-hidden")
         if self.quiet:
             flags.append("quiet")
+        if self.per_item_prompt:
+            flags.append("per-item-prompt")
 
         flag_str = f" [{', '.join(flags)}]" if flags else ""
         return f"{self.__class__.__name__}(target_dir={self.target_dir}{flag_str})"
@@ -22,6 +22,7 @@ class OrganizeConfig:
     always_delete: bool
     never_delete: bool
     include_hidden: bool
+    remember_answers: bool = False
 
     def __post_init__(self):
         """Validate configuration after initialization"""
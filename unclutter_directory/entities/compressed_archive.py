@@ -1,9 +1,7 @@
 import zipfile
 from abc import ABC, abstractmethod
-
-import py7zr
-import rarfile
-from rarfile import RarFile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 
 from unclutter_directory.commons import get_logger
 from unclutter_directory.entities.file import File
@@ -11,49 +9,60 @@ from unclutter_directory.entities.file import File
 logger = get_logger()
 
 
+def _iter_files_from_infos(path: Path, infos: Iterable) -> Iterator[File]:
+    """
+    Yield File entries from zipfile/rarfile info objects.
+
+    The parent path and the File class are bound to locals once instead of
+    being looked up again for every archive member.
+    """
+    make_file = File
+    for info in infos:
+        yield make_file(path, info.filename, info.date_time, info.file_size)
+
+
 class CompressedArchive(ABC):
     @abstractmethod
     def get_files(self, file: File) -> list[File]:
         pass
 
+    def iter_files(self, file: File) -> Iterator[File]:
+        """
+        Iterate over the archive members without building the full list.
+
+        Formats that can stream their listing override this; the default
+        falls back to get_files.
+
+        Args:
+            file: Archive file to read
+
+        Yields:
+            One File per archive member
+        """
+        yield from self.get_files(file)
+
 
 class ZipArchive(CompressedArchive):
     def __init__(self):
         pass
 
     def get_files(self, file: File) -> list[File]:
+        return list(self.iter_files(file))
+
+    def iter_files(self, file: File) -> Iterator[File]:
         archive_path = file.path / file.name
         try:
             # Try with UTF-8 encoding first (handles most modern ZIP files correctly)
             try:
-                with zipfile.ZipFile(
-                    archive_path, "r", metadata_encoding="utf-8"
-                ) as zipf:
-                    return [
-                        File(
-                            file.path,
-                            name,
-                            zipf.getinfo(name).date_time,
-                            zipf.getinfo(name).file_size,
-                        )
-                        for name in zipf.namelist()
-                    ]
+                zipf = zipfile.ZipFile(archive_path, "r", metadata_encoding="utf-8")
             except (TypeError, UnicodeDecodeError):
                 # Fallback for older Python versions or if metadata_encoding is not supported
                 # Also handles cases where the ZIP file metadata is not UTF-8 encoded
-                with zipfile.ZipFile(archive_path, "r") as zipf:
-                    return [
-                        File(
-                            file.path,
-                            name,
-                            zipf.getinfo(name).date_time,
-                            zipf.getinfo(name).file_size,
-                        )
-                        for name in zipf.namelist()
-                    ]
+                zipf = zipfile.ZipFile(archive_path, "r")
+            with zipf:
+                yield from _iter_files_from_infos(file.path, zipf.infolist())
         except zipfile.BadZipFile:
             logger.error(f"❌ Error reading zip file: {archive_path}")
-            return []
 
 
 class RarArchive(CompressedArchive):
@@ -61,21 +70,18 @@ class RarArchive(CompressedArchive):
         pass
 
     def get_files(self, file: File) -> list[File]:
+        return list(self.iter_files(file))
+
+    def iter_files(self, file: File) -> Iterator[File]:
+        # Imported on first use to keep CLI startup fast
+        import rarfile
+
         archive_path = file.path / file.name
         try:
-            with RarFile(archive_path) as rarf:
-                return [
-                    File(
-                        file.path,
-                        name,
-                        rarf.getinfo(name).date_time,
-                        rarf.getinfo(name).file_size,
-                    )
-                    for name in rarf.namelist()
-                ]
+            with rarfile.RarFile(archive_path) as rarf:
+                yield from _iter_files_from_infos(file.path, rarf.infolist())
         except rarfile.Error:
             logger.error(f"❌ Error reading rar file: {archive_path}")
-            return []
 
 
 class SevenZipArchive(CompressedArchive):
@@ -83,6 +89,9 @@ class SevenZipArchive(CompressedArchive):
         pass
 
     def get_files(self, file: File) -> list[File]:
+        # Imported on first use: py7zr pulls in compression and crypto backends
+        import py7zr
+
         archive_path = file.path / file.name
         try:
             with py7zr.SevenZipFile(archive_path, mode="r") as szf:
@@ -113,6 +122,16 @@ class SevenZipArchive(CompressedArchive):
 class ArchiveHandler(ABC):
     """Abstract base class for archive handlers in the chain"""
 
+    # Lowercase final suffixes (with the leading dot) this handler accepts.
+    # Handlers that declare them are found by a dict lookup instead of
+    # probing can_handle in order.
+    extensions: tuple[str, ...] = ()
+
+    def _has_extension(self, file: File) -> bool:
+        """Case-insensitive suffix check that lowercases only the name's tail."""
+        name = file.name
+        return any(name[-len(ext) :].lower() == ext for ext in self.extensions)
+
     @abstractmethod
     def can_handle(self, file: File) -> bool:
         """
@@ -140,8 +159,10 @@ class ArchiveHandler(ABC):
 class ZipHandler(ArchiveHandler):
     """Handler for ZIP archive files."""
 
+    extensions = (".zip",)
+
     def can_handle(self, file: File) -> bool:
-        return file.name.lower().endswith(".zip")
+        return self._has_extension(file)
 
     def create_instance(self) -> CompressedArchive:
         return ZipArchive()
@@ -150,8 +171,10 @@ class ZipHandler(ArchiveHandler):
 class RarHandler(ArchiveHandler):
     """Handler for RAR archive files."""
 
+    extensions = (".rar",)
+
     def can_handle(self, file: File) -> bool:
-        return file.name.lower().endswith(".rar")
+        return self._has_extension(file)
 
     def create_instance(self) -> CompressedArchive:
         return RarArchive()
@@ -160,8 +183,10 @@ class RarHandler(ArchiveHandler):
 class SevenZipHandler(ArchiveHandler):
     """Handler for 7Z archive files."""
 
+    extensions = (".7z",)
+
     def can_handle(self, file: File) -> bool:
-        return file.name.lower().endswith(".7z")
+        return self._has_extension(file)
 
     def create_instance(self) -> CompressedArchive:
         return SevenZipArchive()
@@ -170,16 +195,17 @@ class SevenZipHandler(ArchiveHandler):
 class ArchiveHandlerChain:
     """
     Chain of responsibility pattern for archive file handling.
-    Runs all handlers and returns the first one that can handle the file.
+    Handlers are looked up by file extension; handlers without declared
+    extensions are then probed in order and the first match is returned.
     """
 
     def __init__(self):
         """Initialize archive handler chain with default handlers"""
-        self.handlers: list[ArchiveHandler] = [
-            ZipHandler(),
-            RarHandler(),
-            SevenZipHandler(),
-        ]
+        self.handlers: list[ArchiveHandler] = []
+        self._by_extension: dict[str, ArchiveHandler] = {}
+        self._unindexed: list[ArchiveHandler] = []
+        for handler in (ZipHandler(), RarHandler(), SevenZipHandler()):
+            self.add_handler(handler)
 
     def add_handler(self, handler: ArchiveHandler) -> None:
         """
@@ -189,6 +215,12 @@ class ArchiveHandlerChain:
             handler: ArchiveHandler instance to add
         """
         self.handlers.append(handler)
+        if handler.extensions:
+            # Earlier handlers keep precedence for a shared extension
+            for extension in handler.extensions:
+                self._by_extension.setdefault(extension.lower(), handler)
+        else:
+            self._unindexed.append(handler)
 
     def get_archive_handler(self, file: File) -> CompressedArchive | None:
         """
@@ -200,17 +232,30 @@ class ArchiveHandlerChain:
         Returns:
             CompressedArchive instance or None if no handler can process the file
         """
-        for handler in self.handlers:
+        name = file.name
+        dot = name.rfind(".")
+        handler = self._by_extension.get(name[dot:].lower()) if dot >= 0 else None
+        if handler is not None:
             try:
-                if handler.can_handle(file):
-                    return handler.create_instance()
+                return handler.create_instance()
             except Exception as e:
                 logger.error(f"Handler {handler.__class__.__name__} failed: {e}")
-                continue
+
+        # Handlers without declared extensions are probed in insertion order
+        for handler in self._unindexed:
+            if handler.can_handle(file):
+                try:
+                    return handler.create_instance()
+                except Exception as e:
+                    logger.error(f"Handler {handler.__class__.__name__} failed: {e}")
 
         return None
 
 
+# The default handlers are stateless, so one chain serves every lookup
+_DEFAULT_CHAIN = ArchiveHandlerChain()
+
+
 # Factory function using Chain of Responsibility
 def get_archive_manager(file: File) -> CompressedArchive | None:
     """
@@ -232,5 +277,4 @@ def get_archive_manager(file: File) -> CompressedArchive | None:
         >>> if manager:
         ...     files = manager.get_files(file)
     """
-    handler_chain = ArchiveHandlerChain()
-    return handler_chain.get_archive_handler(file)
+    return _DEFAULT_CHAIN.get_archive_handler(file)
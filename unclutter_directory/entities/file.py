@@ -1,13 +1,27 @@
-import calendar
+import os
+import stat
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from unclutter_directory.commons import get_logger
 
 logger = get_logger()
 
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """Number of days in a month, without calendar.monthrange's call overhead."""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
 
 class File:
+    # Instantiated once per archive member and filesystem entry
+    __slots__ = ("path", "name", "date", "size", "is_directory")
+
     def __init__(
         self, path: Path, name: str, date: float, size: int, is_directory: bool = False
     ):
@@ -20,9 +34,12 @@ class File:
         self.is_directory = is_directory
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _normalize_date_tuple(date_tuple):
         """Normalize a date tuple by correcting invalid components, focusing on days outside the month range.
 
+        Results are cached: archive entries often share the same timestamp.
+
         - Underflow (day < 1): Subtract from previous month (e.g., day 0 in January -> day 31 of previous December).
         - Overflow (day > days in month): Add to next month (e.g., day 32 in April -> day 2 of May).
         - Clamp other components to valid ranges.
@@ -49,11 +66,11 @@ class File:
                 month = 12
                 year -= 1
                 year = max(1970, year)  # Ensure year doesn't go below safe range
-            days_in_prev_month = calendar.monthrange(year, month)[1]
+            days_in_prev_month = _days_in_month(year, month)
             day += days_in_prev_month
 
-        while day > calendar.monthrange(year, month)[1]:
-            days_in_month = calendar.monthrange(year, month)[1]
+        while day > _days_in_month(year, month):
+            days_in_month = _days_in_month(year, month)
             day -= days_in_month
             month += 1
             if month > 12:
@@ -74,14 +91,10 @@ class File:
 
     @staticmethod
     def from_path(file_path: Path):
-        if file_path.is_dir():
-            total_size = 0
-            latest_mtime = 0
-            for child in file_path.rglob("*"):
-                if child.is_file():
-                    total_size += child.stat().st_size
-                    child_mtime = child.stat().st_mtime
-                    latest_mtime = max(latest_mtime, child_mtime)
+        # One stat answers both "is it a directory" and the file's metadata
+        stats = file_path.stat()
+        if stat.S_ISDIR(stats.st_mode):
+            total_size, latest_mtime = File._directory_totals(file_path)
             return File(
                 file_path.parent,
                 file_path.name,
@@ -90,7 +103,6 @@ class File:
                 is_directory=True,
             )
         else:
-            stats = file_path.stat()
             return File(
                 file_path.parent,
                 file_path.name,
@@ -98,3 +110,34 @@ class File:
                 stats.st_size,
                 is_directory=False,
             )
+
+    @staticmethod
+    def _directory_totals(dir_path: Path) -> tuple[int, float]:
+        """Sum file sizes and find the newest file mtime below a directory.
+
+        Walks with os.scandir so directories are recognised from the entry
+        type and every other entry is stat-ed once, with S_ISREG on that
+        result deciding whether it counts. Like Path.rglob, symlinked
+        directories are not descended into and unreadable directories are
+        skipped.
+        """
+        total_size = 0
+        latest_mtime = 0
+        pending = [os.fspath(dir_path)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                            continue
+                        try:
+                            stats = entry.stat()
+                        except OSError:  # Dangling symlink
+                            continue
+                        if stat.S_ISREG(stats.st_mode):
+                            total_size += stats.st_size
+                            latest_mtime = max(latest_mtime, stats.st_mtime)
+            except PermissionError:
+                continue
+        return total_size, latest_mtime
@@ -1,9 +1,5 @@
 from .file_processor import FileProcessor
 
 __all__ = [
-    "ExecutionStrategy",
-    "DryRunStrategy",
-    "AutomaticStrategy",
-    "InteractiveStrategy",
     "FileProcessor",
 ]
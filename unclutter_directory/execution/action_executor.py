@@ -97,40 +97,69 @@ class ActionExecutor:
 
         # Validate action structure using centralized VALID_ACTIONS
         if not action_type or action_type not in validations.VALID_ACTIONS:
-            logger.warning(f"Invalid action type for file {file_path}")
+            logger.warning("Invalid action type for file %s", file_path)
             return None
         if action_type in ["move", "compress"] and not target:
-            logger.warning(f"Missing target for {action_type} action on {file_path}")
+            logger.warning("Missing target for %s action on %s", action_type, file_path)
             return None
 
         # Create strategy instance
         strategy = self.strategy_factory.create_strategy(action_type, logger)
         if not strategy:
             logger.warning(
-                f"Unsupported action type '{action_type}' for file {file_path}"
+                "Unsupported action type '%s' for file %s", action_type, file_path
             )
             return None
 
-        # Pre-execute cleanup check
-        should_clean = rule.get("delete_unpacked_on_match", False)
-        manager = get_archive_manager(File.from_path(file_path))
-        is_preexisting_archive = not file_path.is_dir() and manager is not None
+        # Pre-execute cleanup check, only paid for by rules that request it
+        should_clean = rule.get("delete_unpacked_on_match", False) and (
+            self._is_preexisting_archive(file_path)
+        )
 
         # Execute action using strategy
         try:
             final_path = strategy.execute(file_path, parent_path, target)
-            if should_clean and is_preexisting_archive and final_path is not None:
-                try:
-                    logger.info(
-                        f"Cleaning unpacked directory for preexisting archive {file_path}"
-                    )
-                    cleaner = UnpackedDirectoryCleaner(config)
-                    cleaner.clean(file_path, final_path)
-                except Exception as clean_e:
-                    logger.error(
-                        f"Error during unpacked directory cleanup for {file_path}: {clean_e}"
-                    )
+            if should_clean and final_path is not None:
+                self._clean_unpacked(file_path, final_path, config)
             return final_path
         except Exception as e:
-            logger.error(f"❌ Unexpected error processing {file_path}: {e}")
+            logger.error("❌ Unexpected error processing %s: %s", file_path, e)
             return None
+
+    def _is_preexisting_archive(self, file_path: Path) -> bool:
+        """Check whether a path is an archive file that existed before the action.
+
+        Archive handlers decide by file name alone, so no File.from_path stat
+        (or directory size walk) is needed.
+
+        Args:
+            file_path (Path): Path of the file or directory about to be processed
+
+        Returns:
+            bool: True if the path is a file with a supported archive extension
+        """
+        if file_path.is_dir():
+            return False
+        probe = File(file_path.parent, file_path.name, 0, 0)
+        return get_archive_manager(probe) is not None
+
+    def _clean_unpacked(
+        self, file_path: Path, final_path: Path, config: OrganizeConfig
+    ) -> None:
+        """Remove the unpacked copy of an archive after it was processed.
+
+        Args:
+            file_path (Path): Original path of the archive
+            final_path (Path): Path of the archive after the action
+            config (OrganizeConfig): Configuration for the organize command
+        """
+        try:
+            logger.info(
+                "Cleaning unpacked directory for preexisting archive %s", file_path
+            )
+            cleaner = UnpackedDirectoryCleaner(config)
+            cleaner.clean(file_path, final_path)
+        except Exception as clean_e:
+            logger.error(
+                "Error during unpacked directory cleanup for %s: %s", file_path, clean_e
+            )
@@ -16,7 +16,10 @@ The strategy pattern allows for:
 - More maintainable code structure
 """
 
+import errno
+import os
 import shutil
+import stat
 import zipfile
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -26,6 +29,10 @@ from ..commons import get_logger
 
 logger = get_logger()
 
+# Read size when streaming a source file into a ZIP member. ZipFile.write
+# copies in 8 KiB chunks, which means one compressor call per chunk.
+ZIP_COPY_BUFFER_SIZE = 1024 * 1024
+
 
 class ActionExecutionError(Exception):
     """Exception raised when an action fails but recovery is possible"""
@@ -99,13 +106,19 @@ class ActionStrategy(ABC):
         if not target_path.exists():
             return target_path
 
+        # List the directory once instead of stat-ing every numbered candidate;
+        # the final exists() check still guards case-insensitive filesystems
+        with os.scandir(target_path.parent) as entries:
+            taken = {entry.name for entry in entries}
+
         base_name = target_path.stem
         suffix = 1
         while True:
             new_name = f"{base_name}_{suffix}{target_path.suffix}"
-            new_path = target_path.with_name(new_name)
-            if not new_path.exists():
-                return new_path
+            if new_name not in taken:
+                new_path = target_path.with_name(new_name)
+                if not new_path.exists():
+                    return new_path
             suffix += 1
 
 
@@ -131,7 +144,7 @@ class MoveStrategy(ActionStrategy):
             return False
 
         if not file_path.exists():
-            self._logger.warning(f"Source path does not exist: {file_path}")
+            self._logger.warning("Source path does not exist: %s", file_path)
             return False
 
         # For compatibility with existing tests, delay validation
@@ -150,41 +163,40 @@ class MoveStrategy(ActionStrategy):
             ActionExecutionError: When move fails
         """
         try:
+            # Work on plain strings: a move is a handful of path joins and one
+            # rename, and Path objects are only needed for the return value
+            source = os.fspath(file_path)
+            parent = os.fspath(parent_path)
+            rel_path = os.fspath(file_path.relative_to(parent_path))
+
             # Calculate target path
-            target_dir = self._get_target_directory(target, parent_path)
-            rel_path = file_path.relative_to(parent_path)
-            target_path = target_dir / rel_path
+            target_dir = (
+                target if os.path.isabs(target) else os.path.join(parent, target)
+            )
+            destination = os.path.join(target_dir, rel_path)
 
             # Resolve filename conflicts if needed
-            target_path = self._resolve_conflict(target_path)
+            destination = os.fspath(self._resolve_conflict(Path(destination)))
 
             # Ensure parent directory exists
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Perform the move
-            shutil.move(str(file_path), str(target_path))
-            self._logger.info(f"Moved {file_path} to {target_path}")
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+
+            # Perform the move: a rename within one filesystem, a copy otherwise
+            try:
+                os.rename(source, destination)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(source, destination)
+
+            target_path = Path(destination)
+            self._logger.info("Moved %s to %s", file_path, target_path)
             return target_path
 
         except Exception as e:
-            self._logger.error(f"❌ Unexpected error processing {file_path}: {e}")
+            self._logger.error("❌ Unexpected error processing %s: %s", file_path, e)
             raise
 
-    def _get_target_directory(self, target: str, parent_path: Path) -> Path:
-        """Resolve target directory path from string specification.
-
-        Args:
-            target: Target directory as string (absolute or relative)
-            parent_path: Base directory for relative resolution
-
-        Returns:
-            Path: Resolved directory path
-        """
-        target_path = Path(target)
-        if target_path.is_absolute():
-            return target_path
-        return parent_path / target
-
 
 class DeleteStrategy(ActionStrategy):
     """Strategy for deleting files and directories.
@@ -204,7 +216,7 @@ class DeleteStrategy(ActionStrategy):
             bool: True if delete can be executed
         """
         if not file_path.exists():
-            self._logger.warning(f"Path does not exist: {file_path}")
+            self._logger.warning("Path does not exist: %s", file_path)
             return False
 
         # For delete, we don't need target validation as it's not used
@@ -222,18 +234,28 @@ class DeleteStrategy(ActionStrategy):
             ActionExecutionError: When delete fails
         """
         try:
-            if file_path.is_dir():
+            # Try the single-file removal first instead of stat-ing the path;
+            # unlink refuses directories (EISDIR on Linux, EPERM/EACCES on
+            # macOS and Windows)
+            path = os.fspath(file_path)
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                self._logger.warning("Path vanished before deletion: %s", file_path)
+                return None
+            except OSError:
+                if os.path.islink(path) or not os.path.isdir(path):
+                    raise
                 # Delete directory and all contents
-                shutil.rmtree(file_path)
-                self._logger.info(f"Deleted directory: {file_path}")
-            else:
-                # Delete single file
-                file_path.unlink()
-                self._logger.info(f"Deleted file: {file_path}")
+                shutil.rmtree(path)
+                self._logger.info("Deleted directory: %s", file_path)
                 return None
 
+            self._logger.info("Deleted file: %s", file_path)
+            return None
+
         except Exception as e:
-            self._logger.error(f"❌ Error deleting {file_path}: {e}", exc_info=True)
+            self._logger.error("❌ Error deleting %s: %s", file_path, e, exc_info=True)
             raise
 
 
@@ -245,7 +267,9 @@ class CompressStrategy(ActionStrategy):
     """
 
     # Extensions that are already compressed and should be skipped
-    COMPRESSED_EXTENSIONS = {".zip", ".rar", ".7z", ".tar", ".gz", ".bz2"}
+    COMPRESSED_EXTENSIONS: frozenset[str] = frozenset(
+        {".zip", ".rar", ".7z", ".tar", ".gz", ".bz2"}
+    )
 
     def validate(self, file_path: Path, target: str) -> bool:
         """Validate compression operation parameters.
@@ -262,13 +286,14 @@ class CompressStrategy(ActionStrategy):
             return False
 
         if not file_path.exists():
-            self._logger.warning(f"Source path does not exist: {file_path}")
+            self._logger.warning("Source path does not exist: %s", file_path)
             return False
 
         # Skip if file is already compressed
+        # Check the name before paying for the is_file() stat
         if (
-            file_path.is_file()
-            and file_path.suffix.lower() in self.COMPRESSED_EXTENSIONS
+            file_path.suffix.lower() in self.COMPRESSED_EXTENSIONS
+            and file_path.is_file()
         ):
             # Return True to allow execution, but CompressStrategy will skip it
             return True
@@ -277,10 +302,10 @@ class CompressStrategy(ActionStrategy):
         try:
             target_path = Path(target) if Path(target).is_absolute() else Path(".")
             if target_path.exists() and not target_path.is_dir():
-                self._logger.warning(f"Target is not a directory: {target_path}")
+                self._logger.warning("Target is not a directory: %s", target_path)
                 return False
         except Exception as e:
-            self._logger.warning(f"Invalid target path '{target}': {e}")
+            self._logger.warning("Invalid target path '%s': %s", target, e)
             return False
 
         return True
@@ -296,73 +321,107 @@ class CompressStrategy(ActionStrategy):
         Raises:
             ActionExecutionError: When compression fails
         """
-        # Skip compression for already compressed files
-        if (
-            file_path.is_file()
-            and file_path.suffix.lower() in self.COMPRESSED_EXTENSIONS
-        ):
-            self._logger.info(f"Skipping compression for archive file: {file_path}")
-            return None
-
         try:
+            # One stat decides every file-vs-directory branch below
+            mode = file_path.stat().st_mode
+            is_file = stat.S_ISREG(mode)
+            is_dir = stat.S_ISDIR(mode)
+
+            # Skip compression for already compressed files
+            if is_file and file_path.suffix.lower() in self.COMPRESSED_EXTENSIONS:
+                self._logger.info(
+                    "Skipping compression for archive file: %s", file_path
+                )
+                return None
+
             target_dir = self._get_target_directory(target, parent_path)
             target_dir.mkdir(parents=True, exist_ok=True)
 
             # Generate ZIP filename
-            zip_name = (
-                file_path.stem if file_path.is_file() else file_path.name
-            ) + ".zip"
+            zip_name = (file_path.stem if is_file else file_path.name) + ".zip"
             target_path = target_dir / zip_name
 
             # Resolve filename conflicts
             target_path = self._resolve_conflict(target_path)
 
             # Create ZIP archive
-            self._create_zip_archive(file_path, target_path)
+            self._create_zip_archive(file_path, target_path, is_dir)
 
             # Remove original file/directory after successful compression
-            if file_path.is_dir():
+            if is_dir:
                 shutil.rmtree(file_path)
             else:
                 file_path.unlink()
 
-            self._logger.info(f"Compressed {file_path} to {target_path}")
+            self._logger.info("Compressed %s to %s", file_path, target_path)
             return target_path
 
         except Exception as e:
-            self._logger.error(f"❌ Error compressing {file_path}: {e}", exc_info=True)
+            self._logger.error(
+                "❌ Error compressing %s: %s", file_path, e, exc_info=True
+            )
             raise
 
-    def _create_zip_archive(self, source_path: Path, target_path: Path) -> None:
+    def _create_zip_archive(
+        self, source_path: Path, target_path: Path, is_dir: bool
+    ) -> None:
         """Create ZIP archive from source path.
 
         Args:
             source_path: File or directory to compress
             target_path: Path for the resulting ZIP file
+            is_dir: Whether source_path is a directory
         """
         with zipfile.ZipFile(target_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            if source_path.is_dir():
+            if is_dir:
                 self._add_directory_to_zip(zipf, source_path)
             else:
-                zipf.write(source_path, source_path.name)
+                self._write_file_to_zip(zipf, source_path, source_path.name)
+
+    def _write_file_to_zip(
+        self, zipf: zipfile.ZipFile, file_path: str | Path, arcname: str | Path
+    ) -> None:
+        """Stream a regular file into the archive with a constant-size buffer.
+
+        Args:
+            zipf: ZIP file handle
+            file_path: File to add
+            arcname: Name of the member inside the archive
+        """
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+        zinfo.compress_type = zipf.compression
+        with open(file_path, "rb") as src, zipf.open(zinfo, "w") as dest:
+            shutil.copyfileobj(src, dest, ZIP_COPY_BUFFER_SIZE)
 
     def _add_directory_to_zip(self, zipf: zipfile.ZipFile, source_path: Path) -> None:
         """Add directory contents to ZIP archive recursively.
 
+        Walks with os.scandir so entry types come from the directory listing.
+        Like Path.rglob, symlinked directories are not descended into.
+
         Args:
             zipf: ZIP file handle
             source_path: Directory to add to archive
         """
-        for file_path in source_path.rglob("*"):
-            if file_path.is_file():
-                # Calculate relative path from parent directory for proper structure
-                arcname = file_path.relative_to(source_path.parent)
-                zipf.write(file_path, arcname)
-            elif file_path.is_dir():
-                # Add directory entry only if it's empty (to preserve structure)
-                if not list(file_path.iterdir()):
-                    arcname = file_path.relative_to(source_path.parent)
-                    zipf.writestr(str(arcname) + "/", "")
+        # Archive names are relative to the parent directory for proper structure
+        base = os.fspath(source_path.parent)
+        pending = [os.fspath(source_path)]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    arcname = os.path.relpath(entry.path, base)
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        self._write_file_to_zip(zipf, entry.path, arcname)
+                        continue
+                    elif not entry.is_dir():
+                        continue  # Dangling symlink or special file
+
+                    # Add directory entry only if it's empty (to preserve structure)
+                    with os.scandir(entry.path) as children:
+                        if next(children, None) is None:
+                            zipf.writestr(arcname + "/", "")
 
     def _get_target_directory(self, target: str, parent_path: Path) -> Path:
         """Resolve target directory path for compression.
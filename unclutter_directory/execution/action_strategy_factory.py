@@ -11,6 +11,8 @@ The factory pattern allows for:
 - Consistent instance creation
 """
 
+from typing import Any
+
 from ..commons import get_logger
 from .action_strategies import (
     ActionStrategy,
@@ -29,6 +31,9 @@ class ActionStrategyFactory:
 
     Attributes:
         _strategies: Dictionary mapping action types to strategy classes
+        _instances: Strategy instances already created, keyed by strategy
+            class and logger. Strategies hold no per-file state, so one
+            instance is shared by every file processed with that action.
     """
 
     _strategies: dict[str, type[ActionStrategy]] = {
@@ -37,6 +42,8 @@ class ActionStrategyFactory:
         "compress": CompressStrategy,
     }
 
+    _instances: dict[tuple[type[ActionStrategy], Any], ActionStrategy] = {}
+
     @classmethod
     def create_strategy(
         cls, action_type: str, logger_instance=None
@@ -63,7 +70,11 @@ class ActionStrategyFactory:
         if not strategy_class:
             return None
 
-        return strategy_class(logger_instance)
+        key = (strategy_class, logger_instance)
+        strategy = cls._instances.get(key)
+        if strategy is None:
+            strategy = cls._instances[key] = strategy_class(logger_instance)
+        return strategy
 
     @classmethod
     def get_available_actions(cls) -> list[str]:
@@ -139,7 +150,9 @@ class ActionStrategyFactory:
             >>> ActionStrategyFactory.unregister_strategy('move')  # True
         """
         if action_type in cls._strategies:
-            del cls._strategies[action_type]
+            strategy_class = cls._strategies.pop(action_type)
+            for key in [key for key in cls._instances if key[0] is strategy_class]:
+                del cls._instances[key]
             return True
         return False
 
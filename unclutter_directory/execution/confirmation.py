@@ -8,11 +8,40 @@ modes with proper caching for interactive sessions.
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
 from ..commons import get_logger
 
 logger = get_logger()
 
+_VALID_RESPONSES = frozenset(("y", "n", "a", "never"))
+
+
+@lru_cache(maxsize=32)
+def _split_prompt_template(prompt_template: str) -> tuple[str, str] | None:
+    """
+    Split a prompt template around its single {context} placeholder.
+
+    Args:
+        prompt_template (str): Template for interactive prompts.
+
+    Returns:
+        Optional[tuple[str, str]]: Text before and after the placeholder, or
+        None if the template needs full str.format handling.
+    """
+    prefix, sep, suffix = prompt_template.partition("{context}")
+    if not sep or "{" in prefix + suffix or "}" in prefix + suffix:
+        return None
+    return prefix, suffix
+
+
+def _render_prompt(prompt_template: str, context_info: str) -> str:
+    """Fill in a prompt template, reusing the cached split when possible."""
+    parts = _split_prompt_template(prompt_template)
+    if parts is None:
+        return prompt_template.format(context=context_info)
+    return parts[0] + context_info + parts[1]
+
 
 class ConfirmationHandler(ABC):
     """
@@ -69,7 +98,7 @@ class DryRunConfirmationHandler(ConfirmationHandler):
             bool: Always False in dry-run mode.
         """
         action_desc = action_type if action_type else "execute action"
-        logger.info(f"[DRY RUN] Would {action_desc} for {context_info}")
+        logger.info("[DRY RUN] Would %s for %s", action_desc, context_info)
         return False
 
 
@@ -85,6 +114,10 @@ class AutomaticConfirmationHandler(ConfirmationHandler):
                                  For non-delete actions, this is ignored (always True).
         """
         self.always_confirm = always_confirm
+        # The decision only depends on always_confirm, so bind the specialized
+        # implementation once instead of branching on every call.
+        if always_confirm:
+            self.should_execute = self._always_execute
 
     def should_execute(
         self,
@@ -113,16 +146,33 @@ class AutomaticConfirmationHandler(ConfirmationHandler):
 
         # For delete actions, use the configured preference
         if not self.always_confirm:
-            logger.info(f"Skipping delete action for {context_info} (automatic mode)")
+            logger.info("Skipping delete action for %s (automatic mode)", context_info)
         return self.always_confirm
 
+    @staticmethod
+    def _always_execute(
+        context_info: str,
+        prompt_template: str,
+        cache_key: str | None = None,
+        action_type: str | None = None,
+    ) -> bool:
+        """should_execute for always_confirm=True: every action proceeds."""
+        return True
+
 
 class InteractiveConfirmationHandler(ConfirmationHandler):
     """Handler for interactive execution with user prompts and response caching."""
 
-    def __init__(self):
-        """Initialize interactive handler with empty response cache."""
+    def __init__(self, remember_per_key: bool = False):
+        """
+        Initialize interactive handler with empty response cache.
+
+        Args:
+            remember_per_key (bool): If True, individual y/n answers are also
+                                   cached and reused for the same cache_key.
+        """
         self._responses: dict[str, str] = {}
+        self.remember_per_key = remember_per_key
 
     def should_execute(
         self,
@@ -151,22 +201,17 @@ class InteractiveConfirmationHandler(ConfirmationHandler):
 
         # Check cache for previously stored responses
         if cache_key and cache_key in self._responses:
-            cached_response = self._responses[cache_key]
-            if cached_response == "a":  # Apply to all
-                return True
-            elif cached_response == "never":
-                return False
-            # For individual responses, fall through to prompt again
+            # "y"/"n" are only stored when remember_per_key is enabled
+            return self._responses[cache_key] in ("y", "a")
 
         # Generate and show prompt
-        prompt = prompt_template.format(context=context_info)
-        valid_responses = {"y", "n", "a", "never"}
+        prompt = _render_prompt(prompt_template, context_info)
         default_response = "y"
 
         while True:
             try:
                 response = input(prompt).strip().lower() or default_response
-                if response in valid_responses:
+                if response in _VALID_RESPONSES:
                     break
                 print("Invalid response. Please try again.")
             except (EOFError, KeyboardInterrupt):
@@ -174,7 +219,7 @@ class InteractiveConfirmationHandler(ConfirmationHandler):
                 raise
 
         # Handle special responses that should be cached
-        if response in ("a", "never") and cache_key:
+        if cache_key and (self.remember_per_key or response in ("a", "never")):
             self._responses[cache_key] = response
 
         # Return True for affirmative responses
@@ -8,6 +8,7 @@ from pathlib import Path
 from ..commons import get_logger
 from ..comparison import ArchiveDirectoryComparator
 from ..config.organize_config import OrganizeConfig
+from ..factories.component_factory import ComponentFactory
 
 logger = get_logger()
 
@@ -67,9 +68,6 @@ class UnpackedDirectoryCleaner:
             "Archive and directory are identical. Checking deletion strategy..."
         )
 
-        # Create confirmation handler locally to avoid circular imports
-        from ..factories.component_factory import ComponentFactory
-
         confirmation_handler = ComponentFactory.create_confirmation_handler(self.config)
 
         # Use confirmation handler to decide whether to delete
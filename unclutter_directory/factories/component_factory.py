@@ -2,7 +2,7 @@ import yaml
 
 from unclutter_directory.commons.aliases import Rules
 
-from ..commons import get_logger
+from ..commons import get_logger, load_yaml
 from ..config.delete_unpacked_config import DeleteUnpackedConfig
 from ..config.organize_config import ExecutionMode, OrganizeConfig
 from ..execution.confirmation import (
@@ -16,6 +16,14 @@ from ..file_operations.file_matcher import FileMatcher
 
 logger = get_logger()
 
+# Dry-run and automatic handlers keep no state between calls, so one instance
+# per configuration is shared by every command and unpacked-directory cleanup.
+_DRY_RUN_HANDLER = DryRunConfirmationHandler()
+_AUTOMATIC_HANDLERS = {
+    always_confirm: AutomaticConfirmationHandler(always_confirm=always_confirm)
+    for always_confirm in (False, True)
+}
+
 
 class ComponentFactory:
     """
@@ -66,22 +74,26 @@ class ComponentFactory:
             config: Configuration determining handler type (OrganizeConfig or DeleteUnpackedConfig)
 
         Returns:
-            Appropriate ConfirmationHandler instance
+            Appropriate ConfirmationHandler instance. Stateless dry-run and
+            automatic handlers are shared; interactive handlers are new each
+            time since they cache the user's answers.
         """
-        if config.execution_mode == ExecutionMode.DRY_RUN:
-            return DryRunConfirmationHandler()
-        elif config.execution_mode == ExecutionMode.AUTOMATIC:
+        mode = config.execution_mode
+        if mode == ExecutionMode.DRY_RUN:
+            return _DRY_RUN_HANDLER
+        elif mode == ExecutionMode.AUTOMATIC:
             # For delete-unpacked, use always_delete flag. For organize, non-delete always True (handler internal logic).
             if isinstance(config, DeleteUnpackedConfig):
-                return AutomaticConfirmationHandler(always_confirm=config.always_delete)
+                return _AUTOMATIC_HANDLERS[config.always_delete]
             else:  # OrganizeConfig
                 # Non-delete actions always proceed in automatic mode (handler internal logic handles this)
-                return AutomaticConfirmationHandler(always_confirm=True)
-        elif config.execution_mode == ExecutionMode.INTERACTIVE:
-            return InteractiveConfirmationHandler()
+                return _AUTOMATIC_HANDLERS[True]
+        elif mode == ExecutionMode.INTERACTIVE:
+            remember = isinstance(config, OrganizeConfig) and config.remember_answers
+            return InteractiveConfirmationHandler(remember_per_key=remember)
         else:
             # This should not happen with proper enum usage
-            raise ValueError(f"Unknown execution mode: {config.execution_mode}")
+            raise ValueError(f"Unknown execution mode: {mode}")
 
     @staticmethod
     def _load_rules(rules_file: str) -> Rules:
@@ -96,7 +108,7 @@ class ComponentFactory:
         """
         try:
             with open(rules_file, encoding="utf-8") as f:
-                rules = yaml.safe_load(f)
+                rules = load_yaml(f)
 
             if not isinstance(rules, list):
                 logger.error(f"Rules file {rules_file} must contain a list")
@@ -1,4 +1,8 @@
-from ..commons.validations import parse_size, parse_time
+import re
+from dataclasses import dataclass
+
+from ..commons.aliases import Rule, Rules
+from ..commons.parsers import parse_size, parse_time
 from ..entities.compressed_archive import CompressedArchive, get_archive_manager
 from ..entities.file import File
 
@@ -10,17 +14,81 @@ age constraints, and archive content inspection for compressed files.
 """
 
 
+def _parse_optional(parser, value: str | None) -> int | None:
+    """Apply parser to a condition value, passing a missing value through."""
+    return None if value is None else parser(value)
+
+
+@dataclass(slots=True)
+class CompiledRule:
+    """
+    A rule prepared for matching: the fields read for every file are resolved
+    once, the regex condition is compiled with the flags it matches with, and
+    size/age thresholds are parsed to bytes/seconds.
+    """
+
+    rule: Rule
+    conditions: dict
+    case_sensitive: bool
+    is_directory: bool
+    check_archive: bool
+    regex: re.Pattern | None
+    larger: int | None
+    smaller: int | None
+    older: int | None
+    newer: int | None
+
+    @classmethod
+    def from_rule(cls, rule: Rule) -> "CompiledRule":
+        """
+        Prepare a rule for matching.
+
+        Args:
+            rule: Rule dictionary as loaded from the rules file
+
+        Returns:
+            CompiledRule: The prepared rule
+
+        Raises:
+            re.error: If the regex condition is invalid
+            ValueError: If a size or time condition is invalid
+        """
+        conditions = rule.get("conditions", {})
+        case_sensitive = rule.get("case_sensitive", False)
+        pattern = conditions.get("regex")
+        regex = None
+        if pattern is not None:
+            regex = re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+
+        return cls(
+            rule=rule,
+            conditions=conditions,
+            case_sensitive=case_sensitive,
+            is_directory=rule.get("is_directory", False),
+            check_archive=bool(rule.get("check_archive", False)),
+            regex=regex,
+            larger=_parse_optional(parse_size, conditions.get("larger")),
+            smaller=_parse_optional(parse_size, conditions.get("smaller")),
+            older=_parse_optional(parse_time, conditions.get("older")),
+            newer=_parse_optional(parse_time, conditions.get("newer")),
+        )
+
+
 class FileMatcher:
-    def __init__(self, rules: list[dict]):
+    def __init__(self, rules: Rules):
         """
         Initialize FileMatcher with a list of matching rules.
 
         Args:
-            rules (List[Dict]): A list of dictionaries, where each dictionary
+            rules (Rules): A list of dictionaries, where each dictionary
                 represents a rule with keys like 'conditions', 'case_sensitive',
                 'is_directory', and 'check_archive'.
+
+        Raises:
+            re.error: If a rule has an invalid regex condition
         """
         self.rules = rules
+        self._compiled_rules = [CompiledRule.from_rule(rule) for rule in rules]
 
     def match(self, file: File) -> dict:
         """
@@ -38,25 +106,19 @@ class FileMatcher:
         """
         archive_manager = self._get_archive_manager(file)
 
-        for rule in self.rules:
-            case_sensitive = rule.get("case_sensitive", False)
-            is_directory_rule = rule.get("is_directory", False)
-
-            if file.is_directory != is_directory_rule:
+        for compiled in self._compiled_rules:
+            if file.is_directory != compiled.is_directory:
                 continue
 
-            if self._file_matches_conditions(
-                file, rule.get("conditions", {}), case_sensitive
-            ):
-                return rule
+            if self._file_matches_conditions(file, compiled):
+                return compiled.rule
 
             # If the check_archive condition is set, check the contents of the archive it the rule apply
-            if rule.get("check_archive", {}) and archive_manager is not None:
-                for archived_file in archive_manager.get_files(file):
-                    if self._file_matches_conditions(
-                        archived_file, rule.get("conditions", {}), case_sensitive
-                    ):
-                        return rule
+            if compiled.check_archive and archive_manager is not None:
+                # Stream the listing so a match stops reading the archive
+                for archived_file in archive_manager.iter_files(file):
+                    if self._file_matches_conditions(archived_file, compiled):
+                        return compiled.rule
         return None
 
     def _get_archive_manager(self, file: File) -> CompressedArchive:
@@ -75,9 +137,7 @@ class FileMatcher:
         """
         return get_archive_manager(file)
 
-    def _file_matches_conditions(
-        self, file: File, conditions: dict, case_sensitive: bool
-    ) -> bool:
+    def _file_matches_conditions(self, file: File, compiled: CompiledRule) -> bool:
         """
         Check if a file matches the specified conditions.
 
@@ -86,12 +146,13 @@ class FileMatcher:
 
         Args:
             file (File): The file object to check.
-            conditions (Dict): Dictionary of conditions to match against.
-            case_sensitive (bool): Whether to perform case-sensitive matching.
+            compiled (CompiledRule): The prepared rule whose conditions to check.
 
         Returns:
             bool: True if all conditions are met, False otherwise.
         """
+        conditions = compiled.conditions
+        case_sensitive = compiled.case_sensitive
         name = file.name
 
         if "start" in conditions:
@@ -116,29 +177,21 @@ class FileMatcher:
             else:
                 if conditions["contain"].lower() not in name.lower():
                     return False
-        if "regex" in conditions:
-            import re
-
-            if case_sensitive:
-                if not re.match(conditions["regex"], name):
-                    return False
-            else:
-                # Use a case-insensitive regex pattern
-                if not re.match(conditions["regex"], name, re.IGNORECASE):
-                    return False
+        if compiled.regex is not None and not compiled.regex.match(name):
+            return False
 
         # Size conditions
         size = file.size
-        if "larger" in conditions and size <= parse_size(conditions["larger"]):
+        if compiled.larger is not None and size <= compiled.larger:
             return False
-        if "smaller" in conditions and size >= parse_size(conditions["smaller"]):
+        if compiled.smaller is not None and size >= compiled.smaller:
             return False
 
         # Age conditions
         age_seconds = file.date
-        if "older" in conditions and age_seconds < parse_time(conditions["older"]):
+        if compiled.older is not None and age_seconds < compiled.older:
             return False
-        if "newer" in conditions and age_seconds > parse_time(conditions["newer"]):
+        if compiled.newer is not None and age_seconds > compiled.newer:
             return False
 
         return True
@@ -1,4 +1,5 @@
 import os
+import stat
 
 from ..config.organize_config import OrganizeConfig
 from .base import Validator
@@ -19,11 +20,14 @@ class DirectoryValidator(Validator):
         """
         errors = []
 
-        if not config.target_dir.exists():
+        # One stat call answers both the existence and the type check
+        try:
+            target_mode = config.target_dir.stat().st_mode
+        except OSError:
             errors.append(f"Target directory {config.target_dir} does not exist")
             return errors  # No point in checking further if directory doesn't exist
 
-        if not config.target_dir.is_dir():
+        if not stat.S_ISDIR(target_mode):
             errors.append(f"Target path {config.target_dir} is not a directory")
             return errors
 
@@ -2,8 +2,9 @@ from pathlib import Path
 
 import yaml
 
-from ..commons import get_logger
-from ..commons.validations import Rules, validate_rules_file
+from ..commons import get_logger, load_yaml
+from ..commons.aliases import Rules
+from ..commons.validations import validate_rules_file
 from ..config.organize_config import OrganizeConfig
 from .base import Validator
 
@@ -108,7 +109,8 @@ class RulesFileValidator(Validator):
         """
         Load rules from YAML file with comprehensive error handling.
 
-        Uses safe_load to prevent code injection attacks.
+        Uses a safe loader (LibYAML-backed when available) to prevent code
+        injection attacks.
         Validates basic structure after loading.
 
         Args:
@@ -124,7 +126,7 @@ class RulesFileValidator(Validator):
                     logger.error("Rules file is empty or contains only whitespace")
                     return None
 
-                rules = yaml.safe_load(content)
+                rules = load_yaml(content)
 
             if rules is None:
                 logger.error("Rules file is empty (None content)")